@@ -80,10 +80,13 @@ Usage
 """
 
 from __future__ import annotations
+import functools
 import math
-import re
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  ZONE A — CONFIGURATION
@@ -354,7 +357,7 @@ MATERIAL_ALIASES: Dict[str, str] = {
 }
 
 # All valid GEM material L1 tokens (from GEM v2.0 Appendix A, Table 2)
-MATERIAL_L1_TOKENS = {
+MATERIAL_L1_TOKENS = frozenset({
     "MAT99", "C99", "CU", "CR", "SRC",
     "S", "S99", "SL", "SR", "SO",
     "ME", "ME99", "MEIR", "MEO",
@@ -362,89 +365,89 @@ MATERIAL_L1_TOKENS = {
     "E99", "EU", "ER",
     "W", "W99", "WHE", "WLI", "WS", "WWD", "WBB", "WO",
     "MATO",
-}
+})
 
 # GEM masonry L2 unit technology tokens
-MASONRY_UNIT_TOKENS = {
+MASONRY_UNIT_TOKENS = frozenset({
     "MUN99", "ADO",
     "ST99", "STRUB", "STDRE",
     "CL99", "CLBRS", "CLBRH", "CLBLH",
     "CB99", "CBS", "CBH",
     "MO",
-}
+})
 
 # GEM masonry L2 reinforcement tokens
-MASONRY_REINF_TOKENS = {
+MASONRY_REINF_TOKENS = frozenset({
     "MR99", "RS", "RW", "RB", "RCM", "RCB",
-}
+})
 
 # Masonry L3 mortar tokens
-MORTAR_TOKENS = {
+MORTAR_TOKENS = frozenset({
     "MO99", "MON", "MOM", "MOL", "MOC", "MOCL",
-}
+})
 
 # Masonry L3 stone type tokens
-STONE_TYPE_TOKENS = {
+STONE_TYPE_TOKENS = frozenset({
     "SP99", "SPLI", "SPSA", "SPTU", "SPSL", "SPGR", "SPBA", "SPO",
-}
+})
 
 # GEM LLRS system L1 tokens (Table 3)
-SYSTEM_L1_TOKENS = {
+SYSTEM_L1_TOKENS = frozenset({
     "L99", "LN", "LFM", "LFINF", "LFBR", "LPB",
     "LWAL", "LDUAL", "LFLS", "LFLSINF", "LH", "LO",
-}
+})
 
 # GEM ductility tokens (LLRS L2)
-CODE_LEVEL_TOKENS  = {"CDL", "CDM", "CDH"}
-DUCTILITY_TOKENS   = {"DUL", "DUM", "DNO", "DUC", "DBD", "DU99"}
+CODE_LEVEL_TOKENS  = frozenset({"CDL", "CDM", "CDH"})
+DUCTILITY_TOKENS   = frozenset({"DUL", "DUM", "DNO", "DUC", "DBD", "DU99"})
 
 # GEM irregularity tokens
-IRREG_L1_TOKENS = {"IR99", "IRRE", "IRIR"}
-IRREG_L2_TOKENS = {"IRPP", "IRPS", "IRVP", "IRVS"}
-IRREG_L3_TOKENS = {"IRN", "TOR", "REC", "IRHO", "SOS", "CRW", "SHC", "POP", "SET", "CHV", "IRVO"}
+IRREG_L1_TOKENS = frozenset({"IR99", "IRRE", "IRIR"})
+IRREG_L2_TOKENS = frozenset({"IRPP", "IRPS", "IRVP", "IRVS"})
+IRREG_L3_TOKENS = frozenset({"IRN", "TOR", "REC", "IRHO", "SOS", "CRW", "SHC", "POP", "SET", "CHV", "IRVO"})
 
 # GEM occupancy L1 tokens
-OCCUPANCY_L1_TOKENS = {"OC99","RES","COM","MIX","IND","AGR","ASS","GOV","EDU","OCO"}
+OCCUPANCY_L1_TOKENS = frozenset({"OC99","RES","COM","MIX","IND","AGR","ASS","GOV","EDU","OCO"})
 
 # GEM building position tokens
-POSITION_TOKENS = {"BP99", "BPD", "BP1", "BP2", "BP3"}
+POSITION_TOKENS = frozenset({"BP99", "BPD", "BP1", "BP2", "BP3"})
 
 # GEM plan shape tokens
-PLAN_SHAPE_TOKENS = {
+PLAN_SHAPE_TOKENS = frozenset({
     "PLF99","PLFSQ","PLFSQO","PLFR","PLFRO","PLFL","PLFC","PLFCO",
     "PLFD","PLFDO","PLFP","PLFPO","PLFE","PLFH","PLFS","PLFT",
     "PLFU","PLFX","PLFY","PLFI",
-}
+})
 
 # GEM exterior wall tokens
-EW_TOKENS = {"EW99","EWC","EWG","EWE","EWMA","EWME","EWV","EWW","EWSL","EWPL","EWCB","EWO"}
+EW_TOKENS = frozenset({"EW99","EWC","EWG","EWE","EWMA","EWME","EWV","EWW","EWSL","EWPL","EWCB","EWO"})
 
 # GEM roof shape tokens (Level 1)
-ROOF_SHAPE_TOKENS = {
+ROOF_SHAPE_TOKENS = frozenset({
     "RSH99","RSH1","RSH2","RSH3","RSH4","RSH5","RSH6","RSH7","RSH8","RSH9","RSHO",
-}
+})
 # GEM roof covering tokens (Level 2)
-ROOF_COVERING_TOKENS = {
+ROOF_COVERING_TOKENS = frozenset({
     "RMT99","RMN","RMT1","RMT2","RMT3","RMT4","RMT5","RMT6",
     "RMT7","RMT8","RMT9","RMT10","RMT11","RMTO",
-}
+})
 # GEM roof system material tokens (Level 3 — prefix match)
 ROOF_SYSTEM_PREFIXES = ("RM", "RE", "RC", "RME", "RWO", "RFA", "RO", "R99")
 
 # GEM floor material tokens (Level 1 prefix)
 FLOOR_PREFIXES = ("FM", "FE", "FC", "FME", "FW", "FO", "FN", "F99")
-FLOOR_CONN_TOKENS = {"FWC99", "FWCN", "FWCP"}
+FLOOR_CONN_TOKENS = frozenset({"FWC99", "FWCN", "FWCP"})
 
 # GEM roof connection tokens
-ROOF_CONN_TOKENS = {"RWC99", "RWCN", "RWCP", "RTD99", "RTDN", "RTDP"}
+ROOF_CONN_TOKENS = frozenset({"RWC99", "RWCN", "RWCP", "RTD99", "RTDN", "RTDP"})
 
 # GEM foundation tokens
-FOUNDATION_TOKENS = {"FOS99", "FOSSL", "FOSN", "FOSDL", "FOSDN", "FOSO"}
+FOUNDATION_TOKENS = frozenset({"FOS99", "FOSSL", "FOSN", "FOSDL", "FOSDN", "FOSO"})
 
 # GEM height above-ground key tokens
-HEIGHT_AG_KEYS = {"H", "HBET", "HEX", "HAPP"}
+HEIGHT_AG_KEYS = frozenset({"H", "HBET", "HEX", "HAPP"})
 # GEM year key tokens
-YEAR_KEYS = {"YEX", "YBET", "YPRE", "YAPP", "Y99"}
+YEAR_KEYS = frozenset({"YEX", "YBET", "YPRE", "YAPP", "Y99"})
 
 # ─────────────────────────────────────────────────────────────────────────────
 # A4 — EMS TYPE ASSIGNMENT RULES
@@ -1211,6 +1214,9 @@ MAX_CUMULATIVE_SHIFT   = 2.0   # Maximum total VC shift (sum of all modifiers)
 ENTROPY_PENALTY_ALPHA  = 0.25  # How much EMS entropy penalises confidence
 VC_ORDER = ["A", "B", "C", "D", "E", "F"]  # Vulnerability class order (A=most vulnerable)
 VC_INT   = {"A": 1, "B": 2, "C": 3, "D": 4, "E": 5, "F": 6}  # VC as integer
+TRANSLATE_CACHE_SIZE   = 100_000  # Results kept per engine (0 disables the cache)
+PARSE_CACHE_SIZE       = 8192   # Parsed strings memoised process-wide (0 disables)
+GENERATED_PREDICATES   = True   # Compile rule/modifier conditions to generated code (False: closures, easier to debug)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1219,18 +1225,60 @@ VC_INT   = {"A": 1, "B": 2, "C": 3, "D": 4, "E": 5, "F": 6}  # VC as integer
 #  Do not edit unless extending the engine architecture itself.
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# ── Frozen Zone A tables ───────────────────────────────────────────────────
+# Rules, modifiers and fallback priors are compiled once at import, so a
+# runtime edit would be silently ignored.  The rule lists become tuples so
+# such an edit raises instead; change them in Zone A.  FALLBACK_PRIORS stays
+# a plain dict so it still pickles and serialises, but editing it after
+# import has no effect either.
+EMS_TYPE_RULES  = tuple(EMS_TYPE_RULES)
+VC_MODIFIERS    = tuple(VC_MODIFIERS)
+
+# EMS type codes such as "RC1-L" or "S-M/H" are not identifier-like, so the
+# compiler does not intern them.  Table keys and every type code the rule
+# engine emits go through _intern, so vocabulary probes compare by identity.
+_intern = sys.intern
+
+# ── VC prior tables (structure-of-arrays view of EMS_VOCAB) ────────────────
+# One row per EMS type, columns in VC_ORDER.  Range bounds are VC indices
+# (A=0 … F=5).  EMS_VOCAB remains the editable source of truth.
+_EMS_IDX: Dict[str, int] = {_intern(t): i for i, t in enumerate(EMS_VOCAB)}
+_VC_PRIOR: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(float(v["vc_prior"].get(c, 0.0)) for c in VC_ORDER) for v in EMS_VOCAB.values())
+_VC_RANGE_MIN: Tuple[int, ...] = tuple(
+    VC_ORDER.index(v.get("vc_range_min", "A")) for v in EMS_VOCAB.values())
+_VC_RANGE_MAX: Tuple[int, ...] = tuple(
+    VC_ORDER.index(v.get("vc_range_max", "F")) for v in EMS_VOCAB.values())
+
+
+# p·log(p) for every probability value that appears in the Zone A priors and
+# fallback weights.  Seeded once at import; values outside it (post-shift
+# distributions) fall back to math.log so the table stays bounded.
+_XLOGX: Dict[float, float] = {}
+
+def _seed_xlogx(values: Sequence[float]) -> None:
+    for p in values:
+        if p > 0:
+            _XLOGX.setdefault(p, p * math.log(p))
+
 def _entropy(probs: Sequence[float]) -> float:
     h = 0.0
     for p in probs:
         if p > 0:
-            h -= p * math.log(p)
+            t = _XLOGX.get(p)
+            h -= p * math.log(p) if t is None else t
     return h
 
-def _normalise(d: Dict[str, float]) -> Dict[str, float]:
-    s = sum(max(0.0, v) for v in d.values())
+def _normalise_clipped(lst: Sequence[float]) -> List[float]:
+    """Normalise after clipping negatives to zero (all zeros if nothing left)."""
+    clipped = [max(0.0, v) for v in lst]
+    s = sum(clipped)
     if s <= 0:
-        return {k: 0.0 for k in d}
-    return {k: max(0.0, v) / s for k, v in d.items()}
+        return [0.0] * len(clipped)
+    return [v / s for v in clipped]
+
+def _normalise(d: Dict[str, float]) -> Dict[str, float]:
+    return dict(zip(d, _normalise_clipped(list(d.values()))))
 
 def _normalise_list(lst: List[float]) -> List[float]:
     s = sum(lst)
@@ -1238,29 +1286,71 @@ def _normalise_list(lst: List[float]) -> List[float]:
         return [0.0] * len(lst)
     return [v / s for v in lst]
 
-def _vc_credible_range(vc_probs: Dict[str, float], mass: float = 0.80) -> Tuple[str, str]:
-    probs = [vc_probs.get(c, 0.0) for c in VC_ORDER]
-    best = None
-    for i in range(len(VC_ORDER)):
+# VC distributions travel through the engine as lists in VC_ORDER and VC
+# classes as indices (A=0 … F=5); letters are only produced for the result.
+def _vc_credible_range_idx(probs: Sequence[float], mass: float = 0.80) -> Tuple[int, int]:
+    # Narrowest window reaching `mass`, leftmost on ties.  A later start only
+    # wins if strictly narrower, so each scan stops at the current best width.
+    n = len(probs)
+    best_w, bi, bj = n, 0, len(VC_ORDER) - 1
+    for i in range(n):
         s = 0.0
-        for j in range(i, len(VC_ORDER)):
+        for j in range(i, min(n, i + best_w)):
             s += probs[j]
             if s >= mass:
-                cand = (j - i, i, j)
-                if best is None or cand < best:
-                    best = cand
+                best_w, bi, bj = j - i, i, j
                 break
-    if best is None:
-        return ("A", "F")
-    _, i, j = best
-    return (VC_ORDER[i], VC_ORDER[j])
+        if best_w == 0:
+            break
+    return (bi, bj)
 
-def _vc_mode(vc_probs: Dict[str, float]) -> str:
-    return max(VC_ORDER, key=lambda k: vc_probs.get(k, 0.0))
+def _vc_mode_idx(probs: Sequence[float]) -> int:
+    # First index of the maximum, as max(..., key=) would pick, without a
+    # per-element key call
+    return probs.index(max(probs))
 
+def _vc_credible_range(vc_probs: Dict[str, float], mass: float = 0.80) -> Tuple[str, str]:
+    i, j = _vc_credible_range_idx([vc_probs.get(c, 0.0) for c in VC_ORDER], mass)
+    return (VC_ORDER[i], VC_ORDER[j])
 
+def _vc_mode(vc_probs: Dict[str, float]) -> str:
+    return VC_ORDER[_vc_mode_idx([vc_probs.get(c, 0.0) for c in VC_ORDER])]
+
+# Single-type base distributions: the normalised prior row of each EMS type
+# and its 80% credible range, so a one-candidate base needs no scan.
+_VC_PRIOR_NORM: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(_normalise_list(list(row))) for row in _VC_PRIOR)
+_VC_CR80_BASE: Tuple[Tuple[int, int], ...] = tuple(
+    _vc_credible_range_idx(row) for row in _VC_PRIOR_NORM)
+
+# Exact-override priors: each type's row clipped and normalised, plus the
+# uniform prior used when the override names a type outside EMS_VOCAB.
+_VC_PRIOR_OVERRIDE: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(_normalise_clipped(row)) for row in _VC_PRIOR)
+_VC_UNIFORM: Tuple[float, ...] = tuple(_normalise_clipped([1/6] * len(VC_ORDER)))
+
+# FALLBACK_PRIORS split into (types, weights) with the weights normalised
+# once here instead of whenever a fallback rule fires.
+_FALLBACK_NORM: Dict[str, Tuple[Tuple[str, ...], Tuple[float, ...]]] = {
+    key: (tuple(_intern(t) for t, _ in fb), tuple(_normalise_list([float(w) for _, w in fb])))
+    for key, fb in FALLBACK_PRIORS.items()}
+
+for _row in _VC_PRIOR + _VC_PRIOR_NORM:
+    _seed_xlogx(_row)
+for _types, _row in _FALLBACK_NORM.values():
+    _seed_xlogx(_row)
+del _types, _row
+_VC_ENTROPY_BASE: Tuple[float, ...] = tuple(_entropy(row) for row in _VC_PRIOR_NORM)
+_VC_MODE_BASE: Tuple[int, ...] = tuple(_vc_mode_idx(row) for row in _VC_PRIOR_NORM)
+_VC_ROUNDED_BASE: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(round(p, 4) for p in row) for row in _VC_PRIOR_NORM)
+
+
+# Result classes declare __slots__ explicitly (dataclass(slots=True) needs
+# Python 3.10): no per-instance __dict__, cheaper construction and access.
 @dataclass
 class EmsCandidate:
+    __slots__ = ("ems_type", "weight", "confidence", "rule_id", "rule_trace", "flags")
     ems_type: str
     weight: float
     confidence: float
@@ -1272,6 +1362,11 @@ class EmsCandidate:
 @dataclass
 class TranslationResult:
     """All output fields.  Backward-compatible with original translator_engine.py."""
+    __slots__ = (
+        "gem_str", "parsed", "ems_candidates", "vc_probs", "summary", "uncertainty",
+        "confidence", "warnings", "vc_class", "vc_class_int", "vc_class_base",
+        "vc_class_base_int", "vc_probs_base", "vc_modifiers_applied",
+    )
     # Core (unchanged names)
     gem_str:              str
     parsed:               Dict[str, Any]
@@ -1291,14 +1386,167 @@ class TranslationResult:
     # Modifier trace (new)
     vc_modifiers_applied: List[Dict[str, Any]]
 
+    def copy(self) -> "TranslationResult":
+        """Copy whose dicts and lists are independent of this result."""
+        return TranslationResult(*[_thaw(getattr(self, name)) for name in self.__slots__])
+
+
+_CONTAINERS = (dict, list)
+
+
+def _thaw(value: Any) -> Any:
+    """Rebuild the dicts and lists of a result field; scalars are shared."""
+    cls = value.__class__
+    if cls is dict:
+        value = value.copy()
+        for k, v in value.items():
+            if v.__class__ in _CONTAINERS:
+                value[k] = _thaw(v)
+        return value
+    if cls is list:
+        return [_thaw(v) if v.__class__ in _CONTAINERS else v for v in value]
+    return value
+
+
+# ── Parser tables ──────────────────────────────────────────────────────────
+# Infill and height forms are matched with plain str ops; each helper keeps
+# the exact semantics of the regex noted beside it.
+_INFILL_HEADS = (("LFINF(", 5), ("LFLSINF(", 7))
+
+
+def _split_infill(block: str) -> Optional[Tuple[str, str, str]]:
+    r"""(system, infill, rest) for ``^(LFINF|LFLSINF)\(([^)]+)\)(.*)$``, else None."""
+    for prefix, n in _INFILL_HEADS:
+        if block.startswith(prefix):
+            break
+    else:
+        return None
+    close = block.find(")", n + 1)
+    if close <= n + 1:                    # no ")" or empty parentheses
+        return None
+    rest = block[close + 1:]
+    nl = rest.find("\n")
+    if nl != -1:                          # "." stops at newline; "$" allows one trailing
+        if nl != len(rest) - 1:
+            return None
+        rest = rest[:-1]
+    return block[:n], block[n + 1:close], rest
+
+
+def _digits_end(s: str, i: int) -> int:
+    r"""Index just past the run of decimal digits (regex ``\d``) starting at i."""
+    n = len(s)
+    while i < n and s[i].isdecimal():
+        i += 1
+    return i
+
+# Occupancy L1 tokens grouped by length, so the L2 prefix test is one slice
+# and set probe per distinct length instead of a startswith per token.
+_OCCUPANCY_BY_LEN: Tuple[Tuple[int, frozenset], ...] = tuple(
+    (n, frozenset(t for t in OCCUPANCY_L1_TOKENS if len(t) == n))
+    for n in sorted({len(t) for t in OCCUPANCY_L1_TOKENS}))
+_OCCUPANCY_LONGEST_FIRST = _OCCUPANCY_BY_LEN[::-1]
+
+def _is_occupancy_token(token: str) -> bool:
+    if token in OCCUPANCY_L1_TOKENS:
+        return True
+    # L2 occupancy tokens start with an L1 prefix + digits/letters
+    for n, prefixes in _OCCUPANCY_BY_LEN:
+        if len(token) > n and token[:n] in prefixes:
+            return True
+    return False
+
+
+def _classify_head(head: str) -> str:
+    """Kind of a block head not matched exactly, in _parse_block's order."""
+    if head.startswith(ROOF_SYSTEM_PREFIXES) and head not in MATERIAL_L1_TOKENS:
+        return "roof_system"
+    if head.startswith(FLOOR_PREFIXES) and head not in MATERIAL_L1_TOKENS:
+        return "floor"
+    if _is_occupancy_token(head):
+        return "occupancy"
+    if MATERIAL_ALIASES.get(head, head) in MATERIAL_L1_TOKENS:
+        return "material"
+    if head in SYSTEM_L1_TOKENS:
+        return "system"
+    return "level"
+
+
+# Block heads recognised by exact token match, mapped to their attribute kind.
+# Built in the same precedence order as GemParser._parse_block checks them
+# (first vocabulary wins).  The rest of the closed vocabulary is then
+# pre-classified with _classify_head, so any known head resolves in one
+# lookup; only unknown heads pay for the prefix scans.
+_HEAD_KIND: Dict[str, str] = {}
+for _kind, _vocab in (
+    ("irregularity",  IRREG_L1_TOKENS),
+    ("plan_shape",    PLAN_SHAPE_TOKENS),
+    ("position",      POSITION_TOKENS),
+    ("exterior_wall", EW_TOKENS),
+    ("foundation",    FOUNDATION_TOKENS),
+    ("floor_conn",    FLOOR_CONN_TOKENS),
+    ("roof_conn",     ROOF_CONN_TOKENS),
+    ("roof_shape",    ROOF_SHAPE_TOKENS),
+    ("roof_covering", ROOF_COVERING_TOKENS),
+):
+    for _tok in _vocab:
+        _HEAD_KIND.setdefault(_tok, _kind)
+for _vocab in (MATERIAL_L1_TOKENS, MATERIAL_ALIASES, SYSTEM_L1_TOKENS,
+               OCCUPANCY_L1_TOKENS, CODE_LEVEL_TOKENS, DUCTILITY_TOKENS):
+    for _tok in _vocab:
+        _HEAD_KIND.setdefault(_tok, _classify_head(_tok))
+del _kind, _vocab, _tok
+
+
+# Role of a token following a material head, in _parse_material's order
+# (first vocabulary wins), so each token costs one lookup.
+_MATERIAL_TOKEN_ROLE: Dict[str, str] = {}
+for _role, _vocab in (
+    ("material_L2",   MASONRY_UNIT_TOKENS),
+    ("material_L2",   MASONRY_REINF_TOKENS),
+    ("material_L3",   MORTAR_TOKENS),
+    ("material_L3",   STONE_TYPE_TOKENS),
+    ("ductility",     DUCTILITY_TOKENS),
+    ("code_level",    CODE_LEVEL_TOKENS),
+    ("secondary",     MATERIAL_L1_TOKENS),
+):
+    for _tok in _vocab:
+        _MATERIAL_TOKEN_ROLE.setdefault(_tok, _role)
+del _role, _vocab, _tok
+
+
+# DUCTILITY_MAP keyed on packed token ids: (code_id << 8) | duct_id, with 0
+# standing for "no token".  The fallback chain (exact, code only, ductility
+# only, neither) is resolved at import for every id pair, so _resolve_erd
+# does a single probe.
+_CODE_IDS: Dict[str, int] = {
+    t: i for i, t in enumerate(sorted(CODE_LEVEL_TOKENS | {c for c, _ in DUCTILITY_MAP if c}), 1)}
+_DUCT_IDS: Dict[str, int] = {
+    t: i for i, t in enumerate(sorted(DUCTILITY_TOKENS | {d for _, d in DUCTILITY_MAP if d}), 1)}
+_DUCT_TABLE: Dict[int, Dict[str, Any]] = {
+    (_CODE_IDS.get(c, 0) << 8) | _DUCT_IDS.get(d, 0): info
+    for (c, d), info in DUCTILITY_MAP.items()}
+_DUCT_RESOLVED: Dict[int, Dict[str, Any]] = {
+    key: (_DUCT_TABLE.get(key)
+          or _DUCT_TABLE.get(key & 0xFF00)
+          or _DUCT_TABLE.get(key & 0x00FF)
+          or _DUCT_TABLE[0])
+    for key in ((ci << 8) | di
+                for ci in (0, *_CODE_IDS.values()) for di in (0, *_DUCT_IDS.values()))}
+
 
 class GemParser:
     """Parses a GEM v2.0 taxonomy string into a structured feature dict."""
 
-    # Tokens that look like material L1 but are actually occupancy
-    _OCCUPANCY_PREFIXES = tuple(OCCUPANCY_L1_TOKENS)
-
     def parse(self, gem_str: str) -> Dict[str, Any]:
+        """Feature dict for gem_str; memoised, each call gets its own copy."""
+        if type(self) is not GemParser:
+            # The shared memo is built by a base parser; subclasses that
+            # override _parse/_parse_block must run their own code.
+            return self._parse(gem_str.strip())
+        return _copy_parsed(_parse_cached(gem_str.strip()))
+
+    def _parse(self, gem_str: str) -> Dict[str, Any]:
         out: Dict[str, Any] = {
             # Core structural
             "material":           None,
@@ -1361,11 +1609,9 @@ class GemParser:
         """Route one slash-separated block to the correct parser."""
 
         # ── Infilled frame with parenthetical infill: LFINF(MUR+CBH)+CDL+DUL
-        m_inf = re.match(r"^(LFINF|LFLSINF)\(([^)]+)\)(.*)$", block)
+        m_inf = _split_infill(block)
         if m_inf:
-            system_tok = m_inf.group(1)
-            infill_raw = m_inf.group(2)
-            rest       = m_inf.group(3)
+            system_tok, infill_raw, rest = m_inf
             if out["system"] is None:
                 out["system"] = system_tok
             for itok in infill_raw.split("+"):
@@ -1395,84 +1641,62 @@ class GemParser:
             self._parse_numeric(head, parts, out)
             return
 
+        kind = _HEAD_KIND.get(head)
+        if kind is None:
+            kind = _classify_head(head)
+
         # ── Irregularity
-        if head in IRREG_L1_TOKENS:
+        if kind == "irregularity":
             out["irregularity_L1"] = head
             self._parse_irregularity(parts[1:], out)
-            return
-
         # ── Plan shape
-        if head in PLAN_SHAPE_TOKENS:
+        elif kind == "plan_shape":
             out["plan_shape"] = head
-            return
-
         # ── Building position
-        if head in POSITION_TOKENS:
+        elif kind == "position":
             out["position"] = head
-            return
-
         # ── Exterior wall
-        if head in EW_TOKENS:
+        elif kind == "exterior_wall":
             out["exterior_walls"].append(head)
-            return
-
         # ── Foundation
-        if head in FOUNDATION_TOKENS:
+        elif kind == "foundation":
             out["foundation"] = head
-            return
-
         # ── Floor diaphragm connection tokens
-        if head in FLOOR_CONN_TOKENS:
+        elif kind == "floor_conn":
             out["floor_connection"] = head
-            return
-
         # ── Roof connection tokens
-        if head in ROOF_CONN_TOKENS:
+        elif kind == "roof_conn":
             out["roof_connections"].append(head)
-            return
-
         # ── Roof tokens (shape, covering, system, connection)
-        if head in ROOF_SHAPE_TOKENS:
+        elif kind == "roof_shape":
             out["roof_shape"] = head
             for p in parts[1:]:
                 self._classify_roof_token(p, out)
-            return
-        if head in ROOF_COVERING_TOKENS:
+        elif kind == "roof_covering":
             out["roof_covering"] = head
-            return
-        if any(head.startswith(pfx) for pfx in ROOF_SYSTEM_PREFIXES) and head not in MATERIAL_L1_TOKENS:
+        elif kind == "roof_system":
             self._classify_roof_token(head, out)
             for p in parts[1:]:
                 self._classify_roof_token(p, out)
-            return
-
         # ── Floor tokens
-        if any(head.startswith(pfx) for pfx in FLOOR_PREFIXES) and head not in MATERIAL_L1_TOKENS:
+        elif kind == "floor":
             if out["floor_material"] is None:
                 out["floor_material"] = head
             for p in parts[1:]:
                 if p in FLOOR_CONN_TOKENS:
                     out["floor_connection"] = p
-            return
-
         # ── Occupancy (L1 + optional L2 suffix)
-        if self._is_occupancy(head):
+        elif kind == "occupancy":
             self._parse_occupancy(head, out)
-            return
-
         # ── Material block
-        resolved = MATERIAL_ALIASES.get(head, head)
-        if resolved in MATERIAL_L1_TOKENS:
-            self._parse_material(resolved, parts[1:], out)
-            return
-
+        elif kind == "material":
+            self._parse_material(MATERIAL_ALIASES.get(head, head), parts[1:], out)
         # ── System block
-        if head in SYSTEM_L1_TOKENS:
+        elif kind == "system":
             self._parse_system(head, parts[1:], out)
-            return
-
         # ── Floating ductility / code level tokens
-        self._parse_level_tokens(parts, out)
+        else:
+            self._parse_level_tokens(parts, out)
 
     def _parse_numeric(self, head: str, parts: List[str], out: Dict[str, Any]) -> None:
         key, _, val = head.partition(":")
@@ -1489,13 +1713,18 @@ class GemParser:
         val = val.strip()
         if val.upper() in ("UNK", "UNKN", "?", ""):
             return None
+        if val.isdecimal():               # plain integer, the common case
+            return int(val)
         # HBET:7-9 or HBET:10+ style (range as text)
-        m_range = re.match(r"(\d+)[-–](\d+)", val)
-        if m_range:
-            return int(m_range.group(2))  # upper bound
-        m_plus = re.match(r"(\d+)\+", val)
-        if m_plus:
-            return int(m_plus.group(1))   # lower bound of open range
+        i = _digits_end(val, 0)
+        if i and i < len(val):
+            sep = val[i]
+            if sep == "-" or sep == "–":
+                j = _digits_end(val, i + 1)
+                if j > i + 1:
+                    return int(val[i + 1:j])  # upper bound
+            elif sep == "+":
+                return int(val[:i])       # lower bound of open range
         # HBET:upper,lower (GEM standard numeric)
         if "," in val:
             parts = val.split(",")
@@ -1536,18 +1765,13 @@ class GemParser:
         return None
 
     def _is_occupancy(self, token: str) -> bool:
-        if token in OCCUPANCY_L1_TOKENS:
-            return True
-        # L2 occupancy tokens start with an L1 prefix + digits/letters
-        for pfx in OCCUPANCY_L1_TOKENS:
-            if token.startswith(pfx) and len(token) > len(pfx):
-                return True
-        return False
+        return _is_occupancy_token(token)
 
     def _parse_occupancy(self, token: str, out: Dict[str, Any]) -> None:
-        for pfx in sorted(OCCUPANCY_L1_TOKENS, key=len, reverse=True):
-            if token.startswith(pfx):
-                out["occupancy"] = pfx
+        for n, prefixes in _OCCUPANCY_LONGEST_FIRST:
+            pfx = token[:n]
+            if pfx in prefixes:
+                out["occupancy"] = _intern(pfx)
                 if len(token) > len(pfx):
                     out["occupancy_detail"] = token
                 else:
@@ -1562,17 +1786,16 @@ class GemParser:
 
         for tok in rest:
             tok = MATERIAL_ALIASES.get(tok, tok)
-            if tok in MASONRY_UNIT_TOKENS:
-                out["material_L2"].append(tok)
-            elif tok in MASONRY_REINF_TOKENS:
-                out["material_L2"].append(tok)
-            elif tok in MORTAR_TOKENS or tok in STONE_TYPE_TOKENS:
-                out["material_L3"].append(tok)
-            elif tok in DUCTILITY_TOKENS:
+            role = _MATERIAL_TOKEN_ROLE.get(tok)
+            if role is None:
+                continue
+            if role == "material_L2" or role == "material_L3":
+                out[role].append(tok)
+            elif role == "ductility":
                 self._set_ductility(tok, out)
-            elif tok in CODE_LEVEL_TOKENS:
+            elif role == "code_level":
                 self._set_code_level(tok, out)
-            elif tok in MATERIAL_L1_TOKENS:
+            else:
                 # Secondary material (e.g. CR+PC — precast)
                 out["material_L2"].append(tok)
                 out["material_all"].append(tok)
@@ -1613,90 +1836,238 @@ class GemParser:
             out["roof_covering"] = tok
         elif tok in ROOF_CONN_TOKENS:
             out["roof_connections"].append(tok)
-        elif any(tok.startswith(pfx) for pfx in ("RM","RE","RC","RME","RWO","RFA","R99","RO")):
+        elif tok.startswith(ROOF_SYSTEM_PREFIXES):
             # Roof system material token
             if out["roof_system_material"] is None:
                 out["roof_system_material"] = tok
 
     def _resolve_erd(self, out: Dict[str, Any]) -> None:
-        code = out["code_level"]
-        duct = out["ductility_token"]
-        key = (code, duct)
-        info = (DUCTILITY_MAP.get(key)
-                or DUCTILITY_MAP.get((code, None))
-                or DUCTILITY_MAP.get((None, duct))
-                or DUCTILITY_MAP.get((None, None)))
+        key = (_CODE_IDS.get(out["code_level"], 0) << 8) | _DUCT_IDS.get(out["ductility_token"], 0)
+        info = _DUCT_RESOLVED[key]
         out["erd"]       = info["erd"]
         out["erd_score"] = info["erd_score"]
 
 
-class _RuleEngine:
-    """Applies EMS_TYPE_RULES to parsed features and returns EMS candidates."""
+# Parse results depend only on the string, and exposure data repeats a small
+# vocabulary of taxonomies, so templates are memoised and handed out as
+# copies (translate adds "family"; callers may edit the lists).
+_BASE_PARSER = GemParser()
 
-    def apply(self, parsed: Dict[str, Any]) -> Tuple[List[EmsCandidate], Dict[str, Any]]:
-        warnings: List[str] = []
-        rule_trace: List[str] = []
-
-        # Determine family first (family-assignment rules have priority < 20)
-        family = None
-        for rule in sorted(EMS_TYPE_RULES, key=lambda r: r.get("priority", 999)):
-            then = rule.get("then", {})
-            if "family" not in then:
-                continue
-            if self._matches(rule.get("if", {}), parsed, family):
-                family = then["family"]
-                rule_trace.append(rule["id"])
-                break
-        parsed = dict(parsed, family=family)
 
-        # Base confidence from completeness rubric
-        base_conf = self._base_confidence(parsed)
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(gem_str: str) -> Dict[str, Any]:
+    return _BASE_PARSER._parse(gem_str)
 
-        candidates: List[EmsCandidate] = []
-        for rule in sorted(EMS_TYPE_RULES, key=lambda r: r.get("priority", 999)):
-            if not self._matches(rule.get("if", {}), parsed, family):
-                continue
-            rule_id = rule["id"]
-            then = rule.get("then", {})
-            penalty = float(rule.get("confidence_penalty", 1.0))
+
+def _copy_parsed(template: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v[:] if v.__class__ is list else v for k, v in template.items()}
+
+
+# ── EMS type rule compilation ──────────────────────────────────────────────
+# EMS_TYPE_RULES is interpreted once, at import, into a priority-sorted tuple of
+# (predicate, action, confidence_penalty, rule_id).  Condition lists become
+# frozensets so each predicate is a chain of set tests instead of a dict walk.
+#
+# predicate(mat_pool, mat_l2, system, family, parsed) -> bool
+#   mat_pool : frozenset of material ∪ material_L2 ∪ material_all
+#   mat_l2   : frozenset of material_L2
+# action(erd) -> list of (ems_type, weight, flags), or None for family rules.
+
+def _always(mat_pool, mat_l2, system, family, parsed) -> bool:
+    return True
+
+def _never(mat_pool, mat_l2, system, family, parsed) -> bool:
+    return False
+
+def _is_missing(v: Any) -> bool:
+    return v is None or v == [] or v == ""
+
+def _frozen(val: Any) -> frozenset:
+    """Condition value list as a frozenset of interned strings."""
+    return frozenset(_intern(v) if type(v) is str else v for v in val)
+
+def _compile_condition(key: str, val: Any) -> Callable[..., bool]:
+    if key == "material_any":
+        vset = _frozen(val)
+        return lambda mat_pool, mat_l2, system, family, parsed: not vset.isdisjoint(mat_pool)
+    if key == "material_L2_any":
+        vset = _frozen(val)
+        return lambda mat_pool, mat_l2, system, family, parsed: not vset.isdisjoint(mat_l2)
+    if key == "system_any":
+        vset = _frozen(val)
+        return lambda mat_pool, mat_l2, system, family, parsed: system in vset
+    if key == "family":
+        return lambda mat_pool, mat_l2, system, family, parsed: family == val
+    if key == "missing_any":
+        attrs = tuple(val)
+        return lambda mat_pool, mat_l2, system, family, parsed: any(
+            _is_missing(parsed.get(a)) for a in attrs)
+    return _never   # unknown condition key — rule can never match
+
+def _compile_predicate(cond: Dict[str, Any]) -> Callable[..., bool]:
+    checks = tuple(_compile_condition(k, v) for k, v in cond.items())
+    if not checks:
+        return _always
+    if len(checks) == 1:
+        return checks[0]
+
+    def pred(mat_pool, mat_l2, system, family, parsed) -> bool:
+        for check in checks:
+            if not check(mat_pool, mat_l2, system, family, parsed):
+                return False
+        return True
+    return pred
+
+# Generated-source form of each condition; {v} is the constant's name in the
+# predicate's namespace.  Same semantics as _compile_condition.
+_CONDITION_SOURCE = {
+    "material_any":    ("not {v}.isdisjoint(mat_pool)", _frozen),
+    "material_L2_any": ("not {v}.isdisjoint(mat_l2)",   _frozen),
+    "system_any":      ("system in {v}",                _frozen),
+    "family":          ("family == {v}",                lambda val: val),
+    "missing_any":     ("any(_is_missing(parsed.get(a)) for a in {v})", tuple),
+}
+
+def _generate_predicate(cond: Dict[str, Any]) -> Callable[..., bool]:
+    """exec-compile cond into one flat function with constants as globals."""
+    if not cond:
+        return _always
+    ns: Dict[str, Any] = {"_is_missing": _is_missing}
+    terms = []
+    for i, (key, val) in enumerate(cond.items()):
+        if key not in _CONDITION_SOURCE:
+            return _never   # unknown condition key — rule can never match
+        template, convert = _CONDITION_SOURCE[key]
+        name = f"_c{i}"
+        ns[name] = convert(val)
+        terms.append(f"({template.format(v=name)})")
+    src = ("def pred(mat_pool, mat_l2, system, family, parsed):\n"
+           f"    return {' and '.join(terms)}\n")
+    exec(compile(src, "<gem2ems rule predicate>", "exec"), ns)
+    return ns["pred"]
+
+def _make_predicate(cond: Dict[str, Any]) -> Callable[..., bool]:
+    if GENERATED_PREDICATES:
+        return _generate_predicate(cond)
+    return _compile_predicate(cond)
+
+def _compile_action(then: Dict[str, Any]) -> Optional[Callable[[str], List[Tuple[str, float, List[str]]]]]:
+    if "family" in then:
+        return None
+    if "ems_type" in then:
+        spec = [(_intern(then["ems_type"]), 1.0, [])]
+        return lambda erd: spec
+    if "ems_template" in then:
+        template = then["ems_template"]
+        return lambda erd: [(_intern(template.replace("{erd}", erd)), 1.0, [])]
+    if "fallback" in then:
+        types, weights = _FALLBACK_NORM.get(then["fallback"], ((), ()))
+        if not types:
+            return lambda erd: []
+        spec = [(ems_t, w, ["DISTRIBUTED_MAPPING"]) for ems_t, w in zip(types, weights)]
+        return lambda erd: spec
+    return lambda erd: []
+
+def _compile_rule(rule: Dict[str, Any]) -> Tuple[Callable[..., bool], Any, float, str]:
+    return (_make_predicate(rule.get("if", {})),
+            _compile_action(rule.get("then", {})),
+            float(rule.get("confidence_penalty", 1.0)),
+            rule["id"])
+
+_SORTED_RULES = sorted(EMS_TYPE_RULES, key=lambda r: r.get("priority", 999))
+_COMPILED_RULES = tuple(_compile_rule(r) for r in _SORTED_RULES)
+_COMPILED_FAMILY_RULES = tuple(
+    (_make_predicate(r.get("if", {})), r["then"]["family"], r["id"])
+    for r in _SORTED_RULES if "family" in r.get("then", {}))
+_FALLBACK_KEYS = {r["id"]: r["then"]["fallback"]
+                  for r in _SORTED_RULES if "fallback" in r.get("then", {})}
+
+# Second-pass rules partitioned by family: a rule with a "family" condition
+# can only match in its own family's bucket.  Rules without one (family
+# assignment, failsafe) appear in every bucket, so priority order and the
+# rule trace are unchanged.
+_RULE_FAMILIES = [None] + sorted({fam for _, fam, _ in _COMPILED_FAMILY_RULES})
+_RULES_BY_FAMILY: Dict[Optional[str], Tuple[Tuple[Callable[..., bool], Any, float, str], ...]] = {
+    fam: tuple(compiled for rule, compiled in zip(_SORTED_RULES, _COMPILED_RULES)
+               if rule.get("if", {}).get("family", fam) == fam)
+    for fam in _RULE_FAMILIES
+}
+
+
+# Parsed attributes named by "missing_any" conditions.  Only their
+# presence reaches the rule predicates, so the rule outcome is a pure
+# function of (mat_pool, mat_l2, system, presence, erd) and is memoised below.
+_MISSING_ANY_ATTRS: Tuple[str, ...] = tuple(dict.fromkeys(
+    a for r in _SORTED_RULES for a in r.get("if", {}).get("missing_any", ())))
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_ems_type(mat_pool: frozenset, mat_l2: frozenset, system: Optional[str],
+                      present: Tuple[bool, ...], erd: str) -> Tuple[Any, ...]:
+    """Run both rule passes for one attribute key.
+
+    Returns (family, rule_trace, specs, penalty, rule_id, warnings); specs is
+    empty when no assignment rule produced candidates, and its weights are
+    normalised here, once per key, rather than per translation.
+    """
+    warnings: List[str] = []
+    rule_trace: List[str] = []
+    view: Dict[str, Any] = {a: (True if p else None)
+                            for a, p in zip(_MISSING_ANY_ATTRS, present)}
+
+    # Determine family first (family-assignment rules have priority < 20)
+    family = None
+    for pred, fam, rule_id in _COMPILED_FAMILY_RULES:
+        if pred(mat_pool, mat_l2, system, None, view):
+            family = fam
             rule_trace.append(rule_id)
+            break
+    view["family"] = family
 
-            if "family" in then:
-                continue  # family rules already processed
+    for pred, act, penalty, rule_id in _RULES_BY_FAMILY.get(family, _COMPILED_RULES):
+        if not pred(mat_pool, mat_l2, system, family, view):
+            continue
+        rule_trace.append(rule_id)
 
-            if "ems_type" in then:
-                ems_t = then["ems_type"]
-                candidates.append(EmsCandidate(
-                    ems_type=ems_t, weight=1.0,
-                    confidence=base_conf * penalty,
-                    rule_id=rule_id, rule_trace=list(rule_trace),
-                    flags=[]))
-                break
+        if act is None:
+            continue  # family rules already processed
 
-            elif "ems_template" in then:
-                erd = parsed.get("erd", "L") or "L"
-                ems_t = then["ems_template"].replace("{erd}", erd)
-                candidates.append(EmsCandidate(
-                    ems_type=ems_t, weight=1.0,
-                    confidence=base_conf * penalty,
-                    rule_id=rule_id, rule_trace=list(rule_trace),
-                    flags=[]))
-                break
+        specs = act(erd)
+        if not specs:
+            if rule_id in _FALLBACK_KEYS:
+                warnings.append(f"Fallback key '{_FALLBACK_KEYS[rule_id]}' "
+                                f"not found in FALLBACK_PRIORS.")
+            continue
+        ws = _normalise_list([w for _, w, _ in specs])
+        specs = tuple((t, w, flags) for (t, _, flags), w in zip(specs, ws))
+        return family, tuple(rule_trace), specs, penalty, rule_id, tuple(warnings)
+    return family, tuple(rule_trace), (), 1.0, None, tuple(warnings)
 
-            elif "fallback" in then:
-                fb_key = then["fallback"]
-                fb = FALLBACK_PRIORS.get(fb_key, [])
-                if not fb:
-                    warnings.append(f"Fallback key '{fb_key}' not found in FALLBACK_PRIORS.")
-                    continue
-                total_w = sum(w for _, w in fb)
-                for ems_t, w in fb:
-                    candidates.append(EmsCandidate(
-                        ems_type=ems_t, weight=w / total_w,
-                        confidence=base_conf * penalty,
-                        rule_id=rule_id, rule_trace=list(rule_trace),
-                        flags=["DISTRIBUTED_MAPPING"]))
-                break
+
+class _RuleEngine:
+    """Applies EMS_TYPE_RULES to parsed features and returns EMS candidates."""
+
+    def apply(self, parsed: Dict[str, Any]) -> Tuple[List[EmsCandidate], Dict[str, Any]]:
+        mat    = parsed.get("material")
+        mat_l2 = frozenset(parsed.get("material_L2", []))
+        mat_pool = mat_l2.union(parsed.get("material_all", []), [mat] if mat else [])
+        present = tuple(not _is_missing(parsed.get(a)) for a in _MISSING_ANY_ATTRS)
+        erd = parsed.get("erd", "L") or "L"
+
+        family, trace, specs, penalty, rule_id, warns = _resolve_ems_type(
+            mat_pool, mat_l2, parsed.get("system"), present, erd)
+        rule_trace = list(trace)
+        warnings = list(warns)
+
+        # Base confidence from completeness rubric
+        base_conf = self._base_confidence(parsed)
+
+        candidates: List[EmsCandidate] = [
+            EmsCandidate(ems_type=ems_t, weight=w,
+                         confidence=base_conf * penalty,
+                         rule_id=rule_id, rule_trace=list(rule_trace),
+                         flags=list(flags))
+            for ems_t, w, flags in specs]
 
         if not candidates:
             candidates = [EmsCandidate("M4", 1.0, 0.20, "FAILSAFE", ["FAILSAFE"], ["FAILSAFE"])]
@@ -1704,39 +2075,6 @@ class _RuleEngine:
 
         return candidates, {"rule_trace": rule_trace, "warnings": warnings, "family": family}
 
-    def _matches(self, cond: Dict[str, Any], parsed: Dict[str, Any], family: Optional[str]) -> bool:
-        mat    = parsed.get("material")
-        mat_l2 = parsed.get("material_L2", [])
-        mat_all= parsed.get("material_all", [])
-        system = parsed.get("system")
-        sys_l2 = parsed.get("system_L2", [])
-
-        for key, val in cond.items():
-            if key == "material_any":
-                if not (any(t in set(val) for t in ([mat] if mat else []))
-                        or any(t in set(val) for t in mat_l2)
-                        or any(t in set(val) for t in mat_all)):
-                    return False
-            elif key == "material_L2_any":
-                if not any(t in set(val) for t in mat_l2):
-                    return False
-            elif key == "system_any":
-                if system not in set(val):
-                    return False
-            elif key == "family":
-                if family != val:
-                    return False
-            elif key == "missing_any":
-                for attr in val:
-                    v = parsed.get(attr)
-                    if v is None or v == [] or v == "":
-                        break
-                else:
-                    return False
-            else:
-                return False
-        return True
-
     def _base_confidence(self, parsed: Dict[str, Any]) -> float:
         has_mat  = parsed.get("material") is not None
         has_sys  = parsed.get("system")   is not None
@@ -1753,60 +2091,391 @@ class _RuleEngine:
         return CONFIDENCE_RUBRIC["partial"]
 
 
+# ── VC modifier condition compilers ────────────────────────────────────────
+# One factory per A7 condition key: make(val) -> pred(parsed, ems_type).
+# Each modifier's "if" dict is compiled once at import into a tuple of those
+# predicates (list values frozen into frozensets); unknown keys are dropped
+# (forward-compatible) and "no constraint" values compile to _mod_always.
+_ModPred = Callable[[Dict[str, Any], str], bool]
+
+def _mod_always(parsed: Dict[str, Any], ems_type: str) -> bool:
+    return True
+
+def _eq_check(attr: str) -> Callable[[Any], _ModPred]:
+    def make(val: Any) -> _ModPred:
+        return lambda parsed, ems_type: parsed.get(attr) == val
+    return make
+
+def _in_check(attr: str, empty_passes: bool) -> Callable[[Any], _ModPred]:
+    # empty_passes: an empty list in the rule means "no constraint"
+    def make(val: Any) -> _ModPred:
+        if empty_passes and not val:
+            return _mod_always
+        vset = _frozen(val)
+        return lambda parsed, ems_type: parsed.get(attr) in vset
+    return make
+
+def _any_check(attr: str, empty_passes: bool) -> Callable[[Any], _ModPred]:
+    def make(val: Any) -> _ModPred:
+        if empty_passes and not val:
+            return _mod_always
+        vset = _frozen(val)
+        return lambda parsed, ems_type: not vset.isdisjoint(parsed.get(attr, []))
+    return make
+
+def _types_check(attr: str) -> Callable[[Any], _ModPred]:
+    # Empty list means "no type of this kind present"
+    def make(val: Any) -> _ModPred:
+        if val == []:
+            return lambda parsed, ems_type: not parsed.get(attr, [])
+        vset = _frozen(val)
+        return lambda parsed, ems_type: not vset.isdisjoint(parsed.get(attr, []))
+    return make
+
+def _prefix_check(attr: str) -> Callable[[Any], _ModPred]:
+    def make(val: Any) -> _ModPred:
+        if not val:
+            return _mod_always
+        prefixes = tuple(val)
+        return lambda parsed, ems_type: (parsed.get(attr) or "").startswith(prefixes)
+    return make
+
+def _c_material_any(val: Any) -> _ModPred:
+    vset = _frozen(val)
+    def pred(parsed: Dict[str, Any], ems_type: str) -> bool:
+        mat = parsed.get("material")
+        return ((bool(mat) and mat in vset)
+                or not vset.isdisjoint(parsed.get("material_L2", []))
+                or not vset.isdisjoint(parsed.get("material_all", [])))
+    return pred
+
+def _c_erd_score_below(val: Any) -> _ModPred:
+    def pred(parsed: Dict[str, Any], ems_type: str) -> bool:
+        score = parsed.get("erd_score", 0.0)
+        return score is not None and score < val
+    return pred
+
+def _c_erd_score_above(val: Any) -> _ModPred:
+    def pred(parsed: Dict[str, Any], ems_type: str) -> bool:
+        score = parsed.get("erd_score", 0.0)
+        return score is not None and score >= val
+    return pred
+
+def _c_height_stories_above(val: Any) -> _ModPred:
+    def pred(parsed: Dict[str, Any], ems_type: str) -> bool:
+        h = parsed.get("height_stories")
+        return h is not None and h > val
+    return pred
+
+def _c_year_known(val: Any) -> _ModPred:
+    return lambda parsed, ems_type: (parsed.get("year_value") is not None) == val
+
+def _c_year_before(val: Any) -> _ModPred:
+    def pred(parsed: Dict[str, Any], ems_type: str) -> bool:
+        y = parsed.get("year_value")
+        return y is not None and y < val
+    return pred
+
+def _c_year_after_eq(val: Any) -> _ModPred:
+    def pred(parsed: Dict[str, Any], ems_type: str) -> bool:
+        y = parsed.get("year_value")
+        return y is not None and y >= val
+    return pred
+
+def _c_ems_type_in(val: Any) -> _ModPred:
+    vset = _frozen(val)
+    return lambda parsed, ems_type: ems_type in vset
+
+_MOD_CONDITION_COMPILERS: Dict[str, Callable[[Any], _ModPred]] = {
+    "family_is":                 _eq_check("family"),
+    "family_in":                 _in_check("family", empty_passes=True),
+    "material_is":               _eq_check("material"),
+    "material_any":              _c_material_any,
+    "material_L2_any":           _any_check("material_L2", empty_passes=False),
+    "material_L3_any":           _any_check("material_L3", empty_passes=False),
+    "system_is":                 _eq_check("system"),
+    "system_any":                _in_check("system", empty_passes=False),
+    "infill_any":                _any_check("infill_material", empty_passes=True),
+    "erd_is":                    _eq_check("erd"),
+    "erd_score_below":           _c_erd_score_below,
+    "erd_score_above":           _c_erd_score_above,
+    "ductility_token_in":        _in_check("ductility_token", empty_passes=True),
+    "ductility_token_is":        _eq_check("ductility_token"),
+    "code_level_is":             _eq_check("code_level"),
+    "height_bin_is":             _eq_check("height_bin"),
+    "height_bin_in":             _in_check("height_bin", empty_passes=False),
+    "height_stories_above":      _c_height_stories_above,
+    "year_known":                _c_year_known,
+    "year_before":               _c_year_before,
+    "year_after_eq":             _c_year_after_eq,
+    "occupancy_L1_is":           _eq_check("occupancy"),
+    "occupancy_detail_in":       _in_check("occupancy_detail", empty_passes=True),
+    "position_in":               _in_check("position", empty_passes=False),
+    "plan_shape_in":             _in_check("plan_shape", empty_passes=True),
+    "irregularity_L1_is":        _eq_check("irregularity_L1"),
+    "irregularity_plan_type_in": _types_check("irregularity_plan_types"),
+    "irregularity_vert_type_in": _types_check("irregularity_vert_types"),
+    "roof_covering_in":          _in_check("roof_covering", empty_passes=True),
+    "roof_system_in":            _prefix_check("roof_system_material"),
+    "floor_material_in":         _prefix_check("floor_material"),
+    "floor_conn_is":             _eq_check("floor_connection"),
+    "roof_conn_in":              _any_check("roof_connections", empty_passes=True),
+    "foundation_in":             _in_check("foundation", empty_passes=False),
+    "exterior_wall_any":         _any_check("exterior_walls", empty_passes=True),
+    "ems_type_in":               _c_ems_type_in,
+}
+
+# Parsed attribute behind each condition key whose check can only pass when
+# that attribute is present (not None / empty).  A modifier's required
+# attributes become a bitmask; one AND against the row's presence mask
+# rejects it before any predicate runs.
+_MOD_CONDITION_ATTR: Dict[str, str] = {
+    "family_is":                 "family",
+    "family_in":                 "family",
+    "material_is":               "material",
+    "material_L2_any":           "material_L2",
+    "material_L3_any":           "material_L3",
+    "system_is":                 "system",
+    "system_any":                "system",
+    "infill_any":                "infill_material",
+    "erd_is":                    "erd",
+    "ductility_token_in":        "ductility_token",
+    "ductility_token_is":        "ductility_token",
+    "code_level_is":             "code_level",
+    "height_bin_is":             "height_bin",
+    "height_bin_in":             "height_bin",
+    "height_stories_above":      "height_stories",
+    "year_known":                "year_value",
+    "year_before":               "year_value",
+    "year_after_eq":             "year_value",
+    "occupancy_L1_is":           "occupancy",
+    "occupancy_detail_in":       "occupancy_detail",
+    "position_in":               "position",
+    "plan_shape_in":             "plan_shape",
+    "irregularity_L1_is":        "irregularity_L1",
+    "irregularity_plan_type_in": "irregularity_plan_types",
+    "irregularity_vert_type_in": "irregularity_vert_types",
+    "roof_covering_in":          "roof_covering",
+    "roof_system_in":            "roof_system_material",
+    "floor_material_in":         "floor_material",
+    "floor_conn_is":             "floor_connection",
+    "roof_conn_in":              "roof_connections",
+    "foundation_in":             "foundation",
+    "exterior_wall_any":         "exterior_walls",
+}
+
+def _required_attr(key: str, val: Any) -> Optional[str]:
+    """Attribute that must be present for condition key=val to pass, if any."""
+    attr = _MOD_CONDITION_ATTR.get(key)
+    if attr is None:
+        return None
+    if key == "year_known":
+        return attr if val is True else None
+    if isinstance(val, (list, tuple, set, frozenset)):
+        # Empty lists mean "no constraint" (or "none present"); a listed
+        # None / "" could match a missing attribute.
+        if not val or any(_is_missing(v) for v in val):
+            return None
+        return attr
+    return None if _is_missing(val) else attr
+
+_MOD_PRESENCE_ATTRS: Tuple[str, ...] = tuple(dict.fromkeys(_MOD_CONDITION_ATTR.values()))
+_MOD_PRESENCE_BITS: Dict[str, int] = {a: 1 << i for i, a in enumerate(_MOD_PRESENCE_ATTRS)}
+
+def _presence_mask(parsed: Dict[str, Any]) -> int:
+    mask = 0
+    get = parsed.get
+    for attr, bit in _MOD_PRESENCE_BITS.items():
+        v = get(attr)
+        # Same test as not _is_missing(v), inlined: truthy, or 0 / False
+        if v or (v is not None and v != [] and v != ""):
+            mask |= bit
+    return mask
+
+def _year_range_check(lo: Optional[int], hi: Optional[int]) -> _ModPred:
+    """year_after_eq lo AND year_before hi (either optional) as one check."""
+    if lo is None:
+        return _c_year_before(hi)
+    if hi is None:
+        return _c_year_after_eq(lo)
+    def pred(parsed: Dict[str, Any], ems_type: str) -> bool:
+        y = parsed.get("year_value")
+        return y is not None and lo <= y < hi
+    return pred
+
+def _fuse_year_conditions(cond: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """Condition items with a construction-era bracket folded into one check.
+
+    year_after_eq / year_before become a single range check (in place of the
+    first of them); year_known: true is then implied and dropped.
+    """
+    if "year_before" not in cond and "year_after_eq" not in cond:
+        return list(cond.items())
+    items: List[Tuple[str, Any]] = []
+    fused = False
+    for k, v in cond.items():
+        if k in ("year_before", "year_after_eq"):
+            if not fused:
+                items.append(("_year_range", (cond.get("year_after_eq"), cond.get("year_before"))))
+                fused = True
+        elif not (k == "year_known" and v is True):
+            items.append((k, v))
+    return items
+
+def _compile_modifier(mod: Dict[str, Any], skip: Tuple[str, ...] = ()) -> Tuple[Any, ...]:
+    """(required, preds, contribution, confidence_penalty, id, doc, raw_penalty).
+
+    required is the presence bitmask the row must cover.  Condition keys in
+    skip are left out (already guaranteed by the caller).
+    """
+    required = 0
+    for k, v in mod.get("if", {}).items():
+        if k in _MOD_CONDITION_COMPILERS:
+            attr = _required_attr(k, v)
+            if attr is not None:
+                required |= _MOD_PRESENCE_BITS[attr]
+    preds = tuple(p for p in (_year_range_check(*v) if k == "_year_range"
+                              else _MOD_CONDITION_COMPILERS[k](v)
+                              for k, v in _fuse_year_conditions(mod.get("if", {}))
+                              if k == "_year_range"
+                              or (k in _MOD_CONDITION_COMPILERS and k not in skip))
+                  if p is not _mod_always)
+    raw_shift   = float(mod.get("shift", 0.0))
+    max_contrib = float(mod.get("max_contribution", abs(raw_shift) + 1.0))
+    # Cap individual contribution
+    contrib = max(-max_contrib, min(max_contrib, raw_shift))
+    penalty = mod.get("confidence_penalty", 1.0)
+    return (required, preds, contrib, float(penalty), mod["id"], mod.get("doc", ""), penalty)
+
+_COMPILED_VC_MODIFIERS: Tuple[Tuple[Any, ...], ...] = tuple(
+    _compile_modifier(m) for m in VC_MODIFIERS)
+
+# Modifiers partitioned by family, as the EMS rules are: each bucket keeps,
+# in order, only the modifiers whose family_is / family_in can pass for that
+# family, compiled without those (now redundant) conditions.  A family with
+# no bucket falls back to the full list.
+_MOD_FAMILY_KEYS = ("family_is", "family_in")
+
+def _modifier_families(cond: Dict[str, Any]) -> Optional[frozenset]:
+    """Families a modifier's family conditions admit (None = any)."""
+    fams = None
+    if "family_is" in cond:
+        fams = frozenset([cond["family_is"]])
+    if cond.get("family_in"):
+        allowed = _frozen(cond["family_in"])
+        fams = allowed if fams is None else fams & allowed
+    return fams
+
+_MOD_FAMILY_GATES = tuple(_modifier_families(m.get("if", {})) for m in VC_MODIFIERS)
+_VC_MODIFIERS_BY_FAMILY: Dict[Optional[str], Tuple[Tuple[Any, ...], ...]] = {
+    fam: tuple(_compile_modifier(m, _MOD_FAMILY_KEYS)
+               for m, gate in zip(VC_MODIFIERS, _MOD_FAMILY_GATES)
+               if gate is None or fam in gate)
+    for fam in _RULE_FAMILIES
+}
+
+
+def _walk_modifiers(modifiers: Tuple[Tuple[Any, ...], ...]) -> Callable[[Dict[str, Any], str, int], List[Tuple[Any, ...]]]:
+    """evaluate(parsed, ems_type, present) that walks the compiled modifier list."""
+    def evaluate(parsed: Dict[str, Any], ems_type: str, present: int) -> List[Tuple[Any, ...]]:
+        fired = []
+        for required, preds, *record in modifiers:
+            if required & present == required and all(p(parsed, ems_type) for p in preds):
+                fired.append(tuple(record))
+        return fired
+    return evaluate
+
+def _generate_modifier_evaluator(modifiers: Tuple[Tuple[Any, ...], ...]) -> Callable[[Dict[str, Any], str, int], List[Tuple[Any, ...]]]:
+    """Same as _walk_modifiers, emitted as one straight-line function (mask
+    test and predicate calls per modifier, all constants bound as globals)
+    and exec-compiled."""
+    ns: Dict[str, Any] = {}
+    lines = ["def evaluate(parsed, ems_type, present):",
+             "    fired = []",
+             "    append = fired.append"]
+    for i, (required, preds, *record) in enumerate(modifiers):
+        ns[f"_m{i}"] = tuple(record)
+        terms = [f"present & {required} == {required}"] if required else []
+        for j, pred in enumerate(preds):
+            ns[f"_p{i}_{j}"] = pred
+            terms.append(f"_p{i}_{j}(parsed, ems_type)")
+        lines.append(f"    if {' and '.join(terms) or 'True'}:")
+        lines.append(f"        append(_m{i})")
+    lines.append("    return fired\n")
+    exec(compile("\n".join(lines), "<gem2ems vc modifiers>", "exec"), ns)
+    return ns["evaluate"]
+
+def _modifier_evaluator(modifiers: Tuple[Tuple[Any, ...], ...]) -> Callable[[Dict[str, Any], str, int], List[Tuple[Any, ...]]]:
+    """evaluate(parsed, ems_type, present) -> fired (contrib, penalty, id, doc, raw_penalty) records."""
+    if GENERATED_PREDICATES:
+        return _generate_modifier_evaluator(modifiers)
+    return _walk_modifiers(modifiers)
+
+_VC_MODIFIER_EVALUATORS = {fam: _modifier_evaluator(mods)
+                           for fam, mods in _VC_MODIFIERS_BY_FAMILY.items()}
+_VC_MODIFIER_EVALUATE_ALL = _modifier_evaluator(_COMPILED_VC_MODIFIERS)
+
+
 class _VcModifierEngine:
     """Applies VC_MODIFIERS to the base VC distribution."""
 
     def apply(
         self,
-        vc_probs_base: Dict[str, float],
+        vc_probs_base: Sequence[float],
         parsed: Dict[str, Any],
         final_ems_type: str,
-    ) -> Tuple[Dict[str, float], List[Dict[str, Any]], float]:
+        base_idx: Optional[int] = None,
+    ) -> Tuple[Sequence[float], List[Dict[str, Any]], float, float]:
         """
-        Returns (vc_probs_final, modifiers_applied, cumulative_shift).
+        Returns (vc_probs_final, modifiers_applied, cumulative_shift,
+        confidence_penalty); both distributions are sequences in VC_ORDER and
+        confidence_penalty is the product over the fired modifiers.
+
+        base_idx: EMS type index when vc_probs_base is that type's normalised
+        prior (single-candidate result) — enables the no-modifier fast path.
         """
         applied: List[Dict[str, Any]] = []
         total_shift = 0.0
         conf_penalty_product = 1.0
 
-        for mod in VC_MODIFIERS:
-            if not self._mod_matches(mod.get("if", {}), parsed, final_ems_type):
-                continue
-            raw_shift   = float(mod.get("shift", 0.0))
-            max_contrib = float(mod.get("max_contribution", abs(raw_shift) + 1.0))
-            # Cap individual contribution
-            contrib = max(-max_contrib, min(max_contrib, raw_shift))
+        evaluate = _VC_MODIFIER_EVALUATORS.get(parsed.get("family"), _VC_MODIFIER_EVALUATE_ALL)
+        for contrib, penalty, mod_id, doc, raw_penalty in evaluate(
+                parsed, final_ems_type, _presence_mask(parsed)):
             total_shift += contrib
-            conf_penalty_product *= float(mod.get("confidence_penalty", 1.0))
+            conf_penalty_product *= penalty
             applied.append({
-                "id":                 mod["id"],
-                "doc":                mod.get("doc", ""),
+                "id":                 mod_id,
+                "doc":                doc,
                 "shift":              contrib,
-                "confidence_penalty": mod.get("confidence_penalty", 1.0),
+                "confidence_penalty": raw_penalty,
             })
 
+        # Fast path: nothing fired on a single-type base → precomputed result
+        if not applied and base_idx is not None:
+            return _VC_NOMOD_FINAL[base_idx], applied, total_shift, conf_penalty_product
+
         # Clamp total shift
         total_shift = max(-MAX_CUMULATIVE_SHIFT, min(MAX_CUMULATIVE_SHIFT, total_shift))
 
         # Determine hard bounds from EMS_VOCAB
-        vocab_entry = EMS_VOCAB.get(final_ems_type, {})
-        lo_cls = vocab_entry.get("vc_range_min", "A")
-        hi_cls = vocab_entry.get("vc_range_max", "F")
-        lo_idx = VC_ORDER.index(lo_cls)
-        hi_idx = VC_ORDER.index(hi_cls)
+        t_idx = _EMS_IDX.get(final_ems_type)
+        if t_idx is None:
+            lo_idx, hi_idx = 0, len(VC_ORDER) - 1
+        else:
+            lo_idx, hi_idx = _VC_RANGE_MIN[t_idx], _VC_RANGE_MAX[t_idx]
 
         # Apply smooth fractional shift
         vc_final = self._shift_distribution(vc_probs_base, total_shift, lo_idx, hi_idx)
 
-        return vc_final, applied, total_shift
+        return vc_final, applied, total_shift, conf_penalty_product
 
     def _shift_distribution(
         self,
-        probs: Dict[str, float],
+        probs: Sequence[float],
         shift: float,
         lo_idx: int,
         hi_idx: int,
-    ) -> Dict[str, float]:
+    ) -> List[float]:
         """
         Smooth fractional shift of a 6-bin distribution.
 
@@ -1817,7 +2486,7 @@ class _VcModifierEngine:
         Fractional shifts interpolate linearly between positions.
         Mass cannot leave [lo_idx, hi_idx] (IMS bounds).
         """
-        arr = [probs.get(c, 0.0) for c in VC_ORDER]
+        arr = probs
         n = len(arr)
 
         # Direction: positive shift → toward A (lower index)
@@ -1826,238 +2495,77 @@ class _VcModifierEngine:
         full_steps = int(steps)
         frac = steps - full_steps
 
-        def _shift_once(a: List[float], d: int) -> List[float]:
-            """Shift all mass one full step in direction d (d=+1 → toward A)."""
-            new = [0.0] * n
-            for i in range(n):
-                j = i - d   # source index
-                if 0 <= j < n:
-                    new[i] += a[j]
-                else:
-                    # Clamp: mass stays at boundary
-                    boundary = 0 if d > 0 else n - 1
-                    new[boundary] += a[i]
-            return new
-
-        # Apply full integer steps
-        for _ in range(full_steps):
-            arr = _shift_once(arr, direction)
-
-        # Apply fractional step via linear interpolation
-        if frac > 0:
-            shifted = _shift_once(arr, direction)
-            arr = [arr[i] * (1 - frac) + shifted[i] * frac for i in range(n)]
-
-        # Enforce IMS bounds — zero out mass outside [lo_idx, hi_idx]
-        for i in range(n):
-            if i < lo_idx or i > hi_idx:
-                arr[i] = 0.0
+        # Full and fractional steps in closed form.  k steps toward A read
+        # source bin max(i - k, 0), toward F min(i + k, n - 1) (boundary bins
+        # repeat); the fractional step interpolates with the bin one step
+        # further.  Only bins in [lo_idx, hi_idx] keep mass (IMS bounds), so
+        # only that window is evaluated and nothing is shifted in place.
+        window = range(lo_idx, hi_idx + 1)
+        k = full_steps
+        if not k and not frac:
+            vals = arr[lo_idx:hi_idx + 1]
+        elif direction > 0:
+            if frac > 0:
+                keep = 1 - frac
+                vals = [arr[i - k if i > k else 0] * keep
+                        + arr[i - k - 1 if i > k + 1 else 0] * frac for i in window]
+            else:
+                vals = [arr[i - k if i > k else 0] for i in window]
+        else:
+            last = n - 1
+            if frac > 0:
+                keep = 1 - frac
+                vals = [arr[i + k if i + k < last else last] * keep
+                        + arr[i + k + 1 if i + k + 1 < last else last] * frac for i in window]
+            else:
+                vals = [arr[i + k if i + k < last else last] for i in window]
 
         # Renormalise
-        s = sum(arr)
+        out = [0.0] * n
+        s = sum(vals)
         if s <= 0:
             # Distribute uniformly within bounds as fallback
-            arr = [0.0] * n
-            for i in range(lo_idx, hi_idx + 1):
-                arr[i] = 1.0 / (hi_idx - lo_idx + 1)
+            for i in window:
+                out[i] = 1.0 / (hi_idx - lo_idx + 1)
         else:
-            arr = [v / s for v in arr]
-
-        return {c: arr[i] for i, c in enumerate(VC_ORDER)}
-
-    def _mod_matches(self, cond: Dict[str, Any], parsed: Dict[str, Any], ems_type: str) -> bool:
-        """Evaluate all conditions in a modifier rule (AND logic)."""
-        for key, val in cond.items():
-
-            # ── Parsed attribute conditions ──────────────────────────────
-            if key == "family_is":
-                if parsed.get("family") != val:
-                    return False
-
-            elif key == "family_in":
-                if not val:  # empty list = no constraint
-                    pass
-                elif parsed.get("family") not in val:
-                    return False
-
-            elif key == "material_is":
-                if parsed.get("material") != val:
-                    return False
-
-            elif key == "material_any":
-                mat  = parsed.get("material")
-                matl = parsed.get("material_L2", [])
-                mata = parsed.get("material_all", [])
-                pool = (([mat] if mat else []) + matl + mata)
-                if not any(t in set(val) for t in pool):
-                    return False
-
-            elif key == "material_L2_any":
-                if not any(t in set(val) for t in parsed.get("material_L2", [])):
-                    return False
-
-            elif key == "material_L3_any":
-                if not any(t in set(val) for t in parsed.get("material_L3", [])):
-                    return False
-
-            elif key == "system_is":
-                if parsed.get("system") != val:
-                    return False
-
-            elif key == "system_any":
-                if parsed.get("system") not in set(val):
-                    return False
-
-            elif key == "infill_any":
-                if not val:
-                    pass
-                elif not any(t in set(val) for t in parsed.get("infill_material", [])):
-                    return False
-
-            elif key == "erd_is":
-                if parsed.get("erd") != val:
-                    return False
-
-            elif key == "erd_score_below":
-                score = parsed.get("erd_score", 0.0)
-                if score is None or score >= val:
-                    return False
-
-            elif key == "erd_score_above":
-                score = parsed.get("erd_score", 0.0)
-                if score is None or score < val:
-                    return False
-
-            elif key == "ductility_token_in":
-                if not val:
-                    pass
-                elif parsed.get("ductility_token") not in set(val):
-                    return False
-
-            elif key == "ductility_token_is":
-                if parsed.get("ductility_token") != val:
-                    return False
-
-            elif key == "code_level_is":
-                if parsed.get("code_level") != val:
-                    return False
-
-            elif key == "height_bin_is":
-                if parsed.get("height_bin") != val:
-                    return False
-
-            elif key == "height_bin_in":
-                if parsed.get("height_bin") not in set(val):
-                    return False
-
-            elif key == "height_stories_above":
-                h = parsed.get("height_stories")
-                if h is None or h <= val:
-                    return False
-
-            elif key == "year_known":
-                has_year = parsed.get("year_value") is not None
-                if has_year != val:
-                    return False
-
-            elif key == "year_before":
-                y = parsed.get("year_value")
-                if y is None or y >= val:
-                    return False
-
-            elif key == "year_after_eq":
-                y = parsed.get("year_value")
-                if y is None or y < val:
-                    return False
-
-            elif key == "occupancy_L1_is":
-                if parsed.get("occupancy") != val:
-                    return False
-
-            elif key == "occupancy_detail_in":
-                if not val:
-                    pass
-                elif parsed.get("occupancy_detail") not in set(val):
-                    return False
-
-            elif key == "position_in":
-                if parsed.get("position") not in set(val):
-                    return False
-
-            elif key == "plan_shape_in":
-                if not val:
-                    pass
-                elif parsed.get("plan_shape") not in set(val):
-                    return False
-
-            elif key == "irregularity_L1_is":
-                if parsed.get("irregularity_L1") != val:
-                    return False
-
-            elif key == "irregularity_plan_type_in":
-                # Empty list means "no plan type present"
-                plan_types = parsed.get("irregularity_plan_types", [])
-                if val == []:
-                    if plan_types:
-                        return False
-                elif not any(t in set(val) for t in plan_types):
-                    return False
-
-            elif key == "irregularity_vert_type_in":
-                vert_types = parsed.get("irregularity_vert_types", [])
-                if val == []:
-                    if vert_types:
-                        return False
-                elif not any(t in set(val) for t in vert_types):
-                    return False
-
-            elif key == "roof_covering_in":
-                if not val:
-                    pass
-                elif parsed.get("roof_covering") not in set(val):
-                    return False
-
-            elif key == "roof_system_in":
-                rsm = parsed.get("roof_system_material") or ""
-                if not val:
-                    pass
-                elif not any(rsm == v or rsm.startswith(v) for v in val):
-                    return False
-
-            elif key == "floor_material_in":
-                fm = parsed.get("floor_material") or ""
-                if not val:
-                    pass
-                elif not any(fm == v or fm.startswith(v) for v in val):
-                    return False
-
-            elif key == "floor_conn_is":
-                if parsed.get("floor_connection") != val:
-                    return False
-
-            elif key == "roof_conn_in":
-                if not val:
-                    pass
-                elif not any(t in set(val) for t in parsed.get("roof_connections", [])):
-                    return False
-
-            elif key == "foundation_in":
-                if parsed.get("foundation") not in set(val):
-                    return False
-
-            elif key == "exterior_wall_any":
-                if not val:
-                    pass
-                elif not any(t in set(val) for t in parsed.get("exterior_walls", [])):
-                    return False
-
-            elif key == "ems_type_in":
-                if ems_type not in set(val):
-                    return False
-
-            # Unknown condition key — silently ignore (forward-compatible)
+            out[lo_idx:hi_idx + 1] = [v / s for v in vals]
+
+        return out
 
-        return True
+
+# Final distribution of each single-type base when no modifier fires: a
+# zero shift still clamps to the type's IMS range and renormalises.
+_NOMOD_ENGINE = _VcModifierEngine()
+_VC_NOMOD_FINAL: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(_NOMOD_ENGINE._shift_distribution(
+        list(row), 0.0, _VC_RANGE_MIN[i], _VC_RANGE_MAX[i]))
+    for i, row in enumerate(_VC_PRIOR_NORM))
+_VC_ENTROPY_NOMOD: Tuple[float, ...] = tuple(_entropy(row) for row in _VC_NOMOD_FINAL)
+_VC_MODE_NOMOD: Tuple[int, ...] = tuple(_vc_mode_idx(row) for row in _VC_NOMOD_FINAL)
+_VC_CR80_NOMOD: Tuple[Tuple[int, int], ...] = tuple(
+    _vc_credible_range_idx(row) for row in _VC_NOMOD_FINAL)
+_VC_ROUNDED_NOMOD: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(round(p, 4) for p in row) for row in _VC_NOMOD_FINAL)
+del _NOMOD_ENGINE
+
+
+# Missing-feature bitmask (bit set = attribute absent) → feature names and
+# the diagnostic flags they raise, in output order, for all 16 masks.
+_MISSING_BITS: Tuple[Tuple[int, str], ...] = (
+    (1 << 0, "material"), (1 << 1, "system"), (1 << 2, "height"), (1 << 3, "ductility"))
+_MISSING_FLAG_BITS: Tuple[Tuple[int, str], ...] = (
+    (1 << 3, "ERD_DEFAULTED_TO_L"), (1 << 1, "SYSTEM_MISSING"), (1 << 2, "HEIGHT_MISSING"))
+_MISSING_FEATURES: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(name for bit, name in _MISSING_BITS if m & bit) for m in range(16))
+_MISSING_FLAGS: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(flag for bit, flag in _MISSING_FLAG_BITS if m & bit) for m in range(16))
+
+
+# Parsed keys echoed back on an exact-override result.
+_OVERRIDE_PARSED_KEYS: Tuple[str, ...] = (
+    "material", "material_L2", "system", "system_L2", "erd",
+    "height_stories", "height_bin", "year_value", "irregularity_L1", "family",
+)
 
 
 class gem2ems:
@@ -2070,16 +2578,27 @@ class gem2ems:
         result.vc_class      # → "C"
         result.vc_class_base # → "C"
         result.vc_class_int  # → 3
+
+    One engine may be shared between threads: the result cache is guarded
+    by a lock, and every caller receives its own copy of a cached result.
+    A string translated concurrently by two threads may be computed twice.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_size: int = TRANSLATE_CACHE_SIZE) -> None:
         self._parser        = GemParser()
         self._rule_engine   = _RuleEngine()
         self._modifier_engine = _VcModifierEngine()
 
-        # Build exact override lookup (gem_str → override dict)
+        # LRU cache of results keyed on (gem_str, include_rule_trace, top_k_types).
+        # Entries never leave the engine: callers always receive a copy.
+        self._cache_size = max(0, int(cache_size))
+        self._cache: "OrderedDict[Tuple[str, bool, int], TranslationResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Build exact override lookup (gem_str → override dict).  Usually
+        # empty; translate skips the probe entirely in that case.
         self._exact_overrides: Dict[str, Dict[str, Any]] = {
-            ov["gem"]: ov
+            _intern(ov["gem"]): ov
             for ov in EXACT_OVERRIDES
             if isinstance(ov, dict) and ov.get("gem") and ov.get("ems_type")
         }
@@ -2096,8 +2615,13 @@ class gem2ems:
         if isinstance(gem, str):
             return self.translate_one(gem, include_rule_trace=include_rule_trace,
                                       top_k_types=top_k_types)
-        return [self.translate_one(s, include_rule_trace=include_rule_trace,
-                                   top_k_types=top_k_types) for s in gem]
+        # Exposure data repeats taxonomies heavily: translate each distinct
+        # string once, then give every row its own copy in input order.
+        # Materialise first: the input is read twice and may be an iterator.
+        gem = list(gem)
+        unique = {s: self._lookup(s, include_rule_trace, top_k_types)
+                  for s in dict.fromkeys(gem)}
+        return [unique[s].copy() for s in gem]
 
     def translate_one(
         self,
@@ -2106,14 +2630,116 @@ class gem2ems:
         include_rule_trace: bool = False,
         top_k_types: int = 3,
     ) -> TranslationResult:
+        if not self._cache_size:
+            return self._translate_uncached(gem_str, include_rule_trace, top_k_types)
+        return self._lookup(gem_str, include_rule_trace, top_k_types).copy()
+
+    def _lookup(self, gem_str: str, include_rule_trace: bool, top_k_types: int) -> TranslationResult:
+        """Cached result for gem_str; shared, so never hand it out uncopied."""
+        if not self._cache_size:
+            return self._translate_uncached(gem_str, include_rule_trace, top_k_types)
+        key = (gem_str, include_rule_trace, top_k_types)
+        cache = self._cache
+        with self._cache_lock:
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+                return result
+        # Translate outside the lock so threads only serialise on the cache.
+        result = self._translate_uncached(gem_str, include_rule_trace, top_k_types)
+        self._cache_put(key, result)
+        return result
+
+    def _cache_put(self, key: Tuple[str, bool, int], result: TranslationResult) -> None:
+        cache = self._cache
+        with self._cache_lock:
+            cache[key] = result
+            cache.move_to_end(key)
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+
+    def translate_parallel(
+        self,
+        gem_strs: Sequence[str],
+        *,
+        n_workers: Optional[int] = None,
+        chunksize: int = 1024,
+        include_rule_trace: bool = False,
+        top_k_types: int = 3,
+    ) -> List[TranslationResult]:
+        """
+        Translate a large list across worker processes.
+
+        The input is deduplicated first; distinct strings are sent to a
+        ProcessPoolExecutor in chunks of `chunksize` to amortise IPC.  Results
+        come back in input order and are added to this engine's cache.  Inputs
+        that fit in one chunk (or n_workers=1) are translated in-process.
+        """
+        if chunksize < 1:
+            raise ValueError(f"translate_parallel: chunksize must be >= 1, got {chunksize}")
+        if n_workers is not None and n_workers < 1:
+            raise ValueError(f"translate_parallel: n_workers must be >= 1, got {n_workers}")
+        gem_strs = list(gem_strs)
+        uniques = list(dict.fromkeys(gem_strs))
+        if n_workers == 1 or len(uniques) <= chunksize:
+            return self.translate(gem_strs, include_rule_trace=include_rule_trace,
+                                  top_k_types=top_k_types)
+
+        from concurrent.futures import ProcessPoolExecutor
+        chunks = [uniques[i:i + chunksize] for i in range(0, len(uniques), chunksize)]
+        by_str: Dict[str, TranslationResult] = {}
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(self._exact_overrides,)) as pool:
+            for chunk, results in zip(chunks, pool.map(
+                    _translate_chunk, chunks,
+                    [include_rule_trace] * len(chunks), [top_k_types] * len(chunks))):
+                by_str.update(zip(chunk, results))
+
+        if self._cache_size:
+            for s, r in by_str.items():
+                self._cache_put((s, include_rule_trace, top_k_types), r)
+        return [by_str[s].copy() for s in gem_strs]
+
+    def translate_batch(self, gem_strs: Sequence[str]):
+        """
+        Translate a column of GEM strings straight into a pandas DataFrame.
+
+        Column pipeline: factorise the input, translate each distinct string
+        once, build one row per distinct result, then expand back to input
+        order with a single positional take.  Same columns as to_dataframe().
+        """
+        import pandas as pd
+        codes, uniques = pd.factorize(pd.Series(list(gem_strs), dtype=object), sort=False)
+        # factorize codes None/NaN as -1, which take() would read as the last
+        # row; a missing taxonomy must not inherit another building's result.
+        missing = codes < 0
+        if missing.any():
+            raise ValueError(
+                f"translate_batch: missing GEM string at row {int(missing.argmax())}")
+        frame = to_dataframe([self._lookup(s, False, 3) for s in uniques])
+        return frame.take(codes).reset_index(drop=True)
+
+    def cache_clear(self) -> None:
+        """Drop all cached translation results."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _translate_uncached(
+        self,
+        gem_str: str,
+        include_rule_trace: bool,
+        top_k_types: int,
+    ) -> TranslationResult:
 
         warnings_list: List[str] = []
         gem_str_clean = gem_str.strip()
 
         # ── Check exact override ────────────────────────────────────────
-        ov = self._exact_overrides.get(gem_str_clean)
-        if ov is not None:
-            return self._apply_exact_override(ov, gem_str_clean, include_rule_trace)
+        overrides = self._exact_overrides
+        if overrides:
+            ov = overrides.get(gem_str_clean)
+            if ov is not None:
+                return self._apply_exact_override(ov, gem_str_clean, include_rule_trace)
 
         # ── Parse ───────────────────────────────────────────────────────
         parsed = self._parser.parse(gem_str_clean)
@@ -2135,67 +2761,81 @@ class gem2ems:
                     "M4", c.weight, min(c.confidence, 0.30),
                     c.rule_id, c.rule_trace, c.flags + ["EMS_NOT_IN_VOCAB"]))
 
-        # ── Normalise EMS weights ───────────────────────────────────────
-        ws = _normalise_list([c.weight for c in valid])
-        for c, w in zip(valid, ws):
-            c.weight = w
+        # EMS weights arrive normalised (_resolve_ems_type; FAILSAFE is 1.0).
 
         # ── Build base VC distribution ──────────────────────────────────
-        vc_base = {k: 0.0 for k in VC_ORDER}
-        for c in valid:
-            pri = EMS_VOCAB[c.ems_type]["vc_prior"]
-            for vc, p in pri.items():
-                vc_base[vc] += c.weight * p
-        vc_base = _normalise(vc_base)
-
-        # ── Best EMS type (for modifiers) ───────────────────────────────
-        best = max(valid, key=lambda c: c.weight)
+        single_idx = (_EMS_IDX[valid[0].ems_type]
+                      if len(valid) == 1 and valid[0].weight == 1.0 else None)
+        if single_idx is not None:
+            vc_base = _VC_PRIOR_NORM[single_idx]
+        else:
+            base = [0.0] * len(VC_ORDER)
+            for c in valid:
+                pri = _VC_PRIOR[_EMS_IDX[c.ems_type]]
+                for i, p in enumerate(pri):
+                    base[i] += c.weight * p
+            vc_base = _normalise_list(base)
+
+        # ── Rank EMS candidates; best drives the modifiers ──────────────
+        # sorted() is stable, so sorted_c[0] is the first maximal candidate,
+        # the one max() would pick.  Single candidates skip the sort.
+        sorted_c = (valid if len(valid) == 1
+                    else sorted(valid, key=lambda c: c.weight, reverse=True))
+        best = sorted_c[0]
 
         # ── Apply VC modifiers ──────────────────────────────────────────
-        vc_final, mods_applied, cumul_shift = self._modifier_engine.apply(
-            vc_base, parsed, best.ems_type)
+        vc_final, mods_applied, cumul_shift, mod_conf = self._modifier_engine.apply(
+            vc_base, parsed, best.ems_type, single_idx)
+        nomod_idx = single_idx if not mods_applied else None
 
         # ── Entropy & confidence ────────────────────────────────────────
         ems_entropy  = _entropy([c.weight for c in valid])
-        vc_ent_base  = _entropy([vc_base[c] for c in VC_ORDER])
-        vc_ent_final = _entropy([vc_final[c] for c in VC_ORDER])
+        vc_ent_base  = (_VC_ENTROPY_BASE[single_idx] if single_idx is not None
+                        else _entropy(vc_base))
+        vc_ent_final = (_VC_ENTROPY_NOMOD[nomod_idx] if nomod_idx is not None
+                        else _entropy(vc_final))
 
         conf_map  = sum(c.weight * c.confidence for c in valid)
         n_cands   = max(len(valid), 2)
         H_norm    = ems_entropy / math.log(n_cands)
-        mod_conf  = 1.0
-        for m in mods_applied:
-            mod_conf *= m["confidence_penalty"]
         conf_final = max(0.0, min(1.0, conf_map * (1.0 - ENTROPY_PENALTY_ALPHA * H_norm) * mod_conf))
 
         # ── VC class predictions ────────────────────────────────────────
-        vc_mode_base  = _vc_mode(vc_base)
-        vc_mode_final = _vc_mode(vc_final)
-        cr_base_lo, cr_base_hi   = _vc_credible_range(vc_base)
-        cr_final_lo, cr_final_hi = _vc_credible_range(vc_final)
+        if single_idx is not None:
+            vc_mode_base = _VC_MODE_BASE[single_idx]
+            cr_base_lo, cr_base_hi = _VC_CR80_BASE[single_idx]
+        else:
+            vc_mode_base = _vc_mode_idx(vc_base)
+            cr_base_lo, cr_base_hi = _vc_credible_range_idx(vc_base)
+        if nomod_idx is not None:
+            vc_mode_final = _VC_MODE_NOMOD[nomod_idx]
+            cr_final_lo, cr_final_hi = _VC_CR80_NOMOD[nomod_idx]
+        else:
+            vc_mode_final = _vc_mode_idx(vc_final)
+            cr_final_lo, cr_final_hi = _vc_credible_range_idx(vc_final)
+        vc_letter      = VC_ORDER[vc_mode_final]
+        vc_letter_base = VC_ORDER[vc_mode_base]
+        vc_base_r4  = (_VC_ROUNDED_BASE[single_idx] if single_idx is not None
+                       else [round(p, 4) for p in vc_base])
+        vc_final_r4 = (_VC_ROUNDED_NOMOD[nomod_idx] if nomod_idx is not None
+                       else [round(p, 4) for p in vc_final])
 
         # ── Missing features ────────────────────────────────────────────
-        missing: List[str] = []
-        if parsed.get("material")    is None:    missing.append("material")
-        if parsed.get("system")      is None:    missing.append("system")
-        if parsed.get("height_bin")  is None:    missing.append("height")
-        if parsed.get("ductility_token") is None: missing.append("ductility")
+        missing_mask = ((parsed.get("material") is None)
+                        | (parsed.get("system") is None) << 1
+                        | (parsed.get("height_bin") is None) << 2
+                        | (parsed.get("ductility_token") is None) << 3)
+        missing = list(_MISSING_FEATURES[missing_mask])
 
         # ── Flags ───────────────────────────────────────────────────────
         flags: List[str] = []
         if any("DISTRIBUTED_MAPPING" in c.flags for c in valid):
             flags.append("ONE_TO_MANY_MAPPING")
-        if parsed.get("ductility_token") is None:
-            flags.append("ERD_DEFAULTED_TO_L")
-        if parsed.get("system") is None:
-            flags.append("SYSTEM_MISSING")
-        if parsed.get("height_bin") is None:
-            flags.append("HEIGHT_MISSING")
+        flags.extend(_MISSING_FLAGS[missing_mask])
         if mods_applied:
             flags.append("VC_MODIFIER_APPLIED")
 
         # ── Build candidate output list ─────────────────────────────────
-        sorted_c = sorted(valid, key=lambda c: c.weight, reverse=True)
         out_cands: List[Dict[str, Any]] = []
         for c in sorted_c[:max(1, top_k_types)]:
             d = {
@@ -2252,16 +2892,16 @@ class gem2ems:
                 "family":           parsed.get("family"),
             },
             ems_candidates = out_cands,
-            vc_probs       = {k: round(vc_final[k], 4) for k in VC_ORDER},
-            vc_probs_base  = {k: round(vc_base[k],  4) for k in VC_ORDER},
+            vc_probs       = dict(zip(VC_ORDER, vc_final_r4)),
+            vc_probs_base  = dict(zip(VC_ORDER, vc_base_r4)),
             summary        = {
                 "best_ems_type":             best.ems_type,
                 "best_ems_weight":           round(best.weight, 4),
-                "best_vc_mode":              vc_mode_final,   # backward-compatible
-                "best_vc_mode_base":         vc_mode_base,
-                "best_vc_mode_final":        vc_mode_final,
-                "vc_credible_range_80":      f"{cr_final_lo}-{cr_final_hi}",
-                "vc_credible_range_80_base": f"{cr_base_lo}-{cr_base_hi}",
+                "best_vc_mode":              vc_letter,   # backward-compatible
+                "best_vc_mode_base":         vc_letter_base,
+                "best_vc_mode_final":        vc_letter,
+                "vc_credible_range_80":      f"{VC_ORDER[cr_final_lo]}-{VC_ORDER[cr_final_hi]}",
+                "vc_credible_range_80_base": f"{VC_ORDER[cr_base_lo]}-{VC_ORDER[cr_base_hi]}",
                 "exact_override":            False,
                 "n_modifiers_fired":         len(mods_applied),
                 "cumulative_shift":          round(cumul_shift, 3),
@@ -2278,10 +2918,10 @@ class gem2ems:
             },
             confidence             = round(conf_final, 4),
             warnings               = warnings_list,
-            vc_class               = vc_mode_final,
-            vc_class_int           = VC_INT[vc_mode_final],
-            vc_class_base          = vc_mode_base,
-            vc_class_base_int      = VC_INT[vc_mode_base],
+            vc_class               = vc_letter,
+            vc_class_int           = vc_mode_final + 1,
+            vc_class_base          = vc_letter_base,
+            vc_class_base_int      = vc_mode_base + 1,
             vc_modifiers_applied   = mods_applied,
         )
 
@@ -2294,33 +2934,31 @@ class gem2ems:
         parsed = self._parser.parse(gem_str)
         ems_t  = ov["ems_type"]
         conf   = float(ov.get("confidence", 0.99))
-        vocab  = EMS_VOCAB.get(ems_t, {})
-        prior  = vocab.get("vc_prior", {c: 1/6 for c in VC_ORDER})
-        prior  = _normalise(prior)
+        t_idx  = _EMS_IDX.get(ems_t)
+        prior  = _VC_UNIFORM if t_idx is None else _VC_PRIOR_OVERRIDE[t_idx]
 
         # Optional forced VC class
         forced_vc = ov.get("vc_class")
         if forced_vc and forced_vc in VC_ORDER:
-            vc_final = {c: (1.0 if c == forced_vc else 0.0) for c in VC_ORDER}
+            vc_final = tuple(1.0 if c == forced_vc else 0.0 for c in VC_ORDER)
         else:
-            vc_final = dict(prior)
-        vc_mode = _vc_mode(vc_final)
-        cr_lo, cr_hi = _vc_credible_range(vc_final)
+            vc_final = prior
+        vc_mode      = VC_ORDER[_vc_mode_idx(vc_final)]
+        vc_mode_base = VC_ORDER[_vc_mode_idx(prior)]
+        cr_lo, cr_hi = (VC_ORDER[i] for i in _vc_credible_range_idx(vc_final))
 
         return TranslationResult(
             gem_str   = gem_str,
-            parsed    = {k: parsed.get(k) for k in [
-                "material","material_L2","system","system_L2","erd",
-                "height_stories","height_bin","year_value","irregularity_L1","family"]},
+            parsed    = {k: parsed.get(k) for k in _OVERRIDE_PARSED_KEYS},
             ems_candidates = [{"ems_type": ems_t, "weight": 1.0,
                                 "confidence": conf, "rule_id": "EXACT_OVERRIDE", "flags": ["EXACT_OVERRIDE"]}],
-            vc_probs       = {k: round(vc_final[k], 4) for k in VC_ORDER},
-            vc_probs_base  = {k: round(prior[k],    4) for k in VC_ORDER},
+            vc_probs       = {k: round(vc_final[i], 4) for i, k in enumerate(VC_ORDER)},
+            vc_probs_base  = {k: round(prior[i],    4) for i, k in enumerate(VC_ORDER)},
             summary        = {
                 "best_ems_type":             ems_t,
                 "best_ems_weight":           1.0,
                 "best_vc_mode":              vc_mode,
-                "best_vc_mode_base":         _vc_mode(prior),
+                "best_vc_mode_base":         vc_mode_base,
                 "best_vc_mode_final":        vc_mode,
                 "vc_credible_range_80":      f"{cr_lo}-{cr_hi}",
                 "vc_credible_range_80_base": f"{cr_lo}-{cr_hi}",
@@ -2331,8 +2969,8 @@ class gem2ems:
             uncertainty    = {
                 "missing_features":          [],
                 "ems_entropy":               0.0,
-                "vc_entropy":                round(_entropy(list(vc_final.values())), 4),
-                "vc_entropy_base":           round(_entropy(list(prior.values())), 4),
+                "vc_entropy":                round(_entropy(vc_final), 4),
+                "vc_entropy_base":           round(_entropy(prior), 4),
                 "top1_margin":               1.0,
                 "modifier_confidence_penalty": 1.0,
                 "flags":                     ["EXACT_OVERRIDE"],
@@ -2341,71 +2979,97 @@ class gem2ems:
             warnings               = [],
             vc_class               = vc_mode,
             vc_class_int           = VC_INT[vc_mode],
-            vc_class_base          = _vc_mode(prior),
-            vc_class_base_int      = VC_INT[_vc_mode(prior)],
+            vc_class_base          = vc_mode_base,
+            vc_class_base_int      = VC_INT[vc_mode_base],
             vc_modifiers_applied   = [],
         )
 
     # ── Backward-compatible aliases ────────────────────────────────────────
     def translate_many(self, gem_list: List[str], **kwargs) -> List[TranslationResult]:
-        return [self.translate_one(s, **kwargs) for s in gem_list]
+        return self.translate(list(gem_list), **kwargs)
 
 
 # Backward-compatible class alias (v1 name)
 TranslatorEngine = gem2ems
 
 
+# ── Worker-process entry points for gem2ems.translate_parallel ─────────────
+# Module-level so they pickle by reference.  Each worker builds one engine,
+# uncached (every chunk holds distinct strings), carrying the parent's
+# exact-override table.
+_WORKER_ENGINE: Optional[gem2ems] = None
+
+def _init_worker(exact_overrides: Dict[str, Dict[str, Any]]) -> None:
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = gem2ems(cache_size=0)
+    _WORKER_ENGINE._exact_overrides = exact_overrides
+
+def _translate_chunk(chunk: List[str], include_rule_trace: bool,
+                     top_k_types: int) -> List[TranslationResult]:
+    eng = _WORKER_ENGINE if _WORKER_ENGINE is not None else gem2ems(cache_size=0)
+    return [eng.translate_one(s, include_rule_trace=include_rule_trace,
+                              top_k_types=top_k_types) for s in chunk]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  ZONE C — UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Column order of to_dataframe(); _dataframe_row yields values in this order.
+_DATAFRAME_COLUMNS: Tuple[str, ...] = (
+    # Original v1 columns — unchanged
+    "gem_str", "best_ems_type", "best_ems_weight", "best_vc_mode", "vc_range_80",
+    "confidence", "ems_entropy", "vc_entropy", "missing_features",
+    # New columns
+    "vc_class", "vc_class_int", "vc_class_base", "vc_class_base_int",
+    *(f"vc_probs_{c}" for c in VC_ORDER),
+    *(f"vc_probs_base_{c}" for c in VC_ORDER),
+    "vc_range_80_base", "vc_entropy_base",
+    "n_modifiers_fired", "cumulative_shift", "mod_conf_penalty", "flags",
+    # Parsed key fields
+    "material", "system", "erd", "height_bin", "occupancy", "family",
+)
+
+
+def _dataframe_row(r: TranslationResult) -> Tuple[Any, ...]:
+    summary, unc, parsed = r.summary, r.uncertainty, r.parsed
+    probs, base = r.vc_probs, r.vc_probs_base
+    return (
+        r.gem_str,
+        summary["best_ems_type"],
+        summary["best_ems_weight"],
+        summary["best_vc_mode"],
+        summary["vc_credible_range_80"],
+        r.confidence,
+        unc["ems_entropy"],
+        unc["vc_entropy"],
+        ",".join(unc["missing_features"]),
+        r.vc_class,
+        r.vc_class_int,
+        r.vc_class_base,
+        r.vc_class_base_int,
+        *[probs.get(c, 0.0) for c in VC_ORDER],
+        *[base.get(c, 0.0) for c in VC_ORDER],
+        summary["vc_credible_range_80_base"],
+        unc["vc_entropy_base"],
+        summary["n_modifiers_fired"],
+        summary["cumulative_shift"],
+        unc["modifier_confidence_penalty"],
+        "|".join(unc["flags"]),
+        parsed.get("material"),
+        parsed.get("system"),
+        parsed.get("erd"),
+        parsed.get("height_bin"),
+        parsed.get("occupancy"),
+        parsed.get("family"),
+    )
+
+
 def to_dataframe(results: List[TranslationResult]):
     """Convert a list of TranslationResult objects to a pandas DataFrame."""
     import pandas as pd
-    rows = []
-    for r in results:
-        row = {
-            # Original v1 columns — unchanged
-            "gem_str":           r.gem_str,
-            "best_ems_type":     r.summary["best_ems_type"],
-            "best_ems_weight":   r.summary["best_ems_weight"],
-            "best_vc_mode":      r.summary["best_vc_mode"],
-            "vc_range_80":       r.summary["vc_credible_range_80"],
-            "confidence":        r.confidence,
-            "ems_entropy":       r.uncertainty["ems_entropy"],
-            "vc_entropy":        r.uncertainty["vc_entropy"],
-            "missing_features":  ",".join(r.uncertainty["missing_features"]),
-            # New columns
-            "vc_class":          r.vc_class,
-            "vc_class_int":      r.vc_class_int,
-            "vc_class_base":     r.vc_class_base,
-            "vc_class_base_int": r.vc_class_base_int,
-            "vc_probs_A":        r.vc_probs.get("A", 0.0),
-            "vc_probs_B":        r.vc_probs.get("B", 0.0),
-            "vc_probs_C":        r.vc_probs.get("C", 0.0),
-            "vc_probs_D":        r.vc_probs.get("D", 0.0),
-            "vc_probs_E":        r.vc_probs.get("E", 0.0),
-            "vc_probs_F":        r.vc_probs.get("F", 0.0),
-            "vc_probs_base_A":   r.vc_probs_base.get("A", 0.0),
-            "vc_probs_base_B":   r.vc_probs_base.get("B", 0.0),
-            "vc_probs_base_C":   r.vc_probs_base.get("C", 0.0),
-            "vc_probs_base_D":   r.vc_probs_base.get("D", 0.0),
-            "vc_probs_base_E":   r.vc_probs_base.get("E", 0.0),
-            "vc_probs_base_F":   r.vc_probs_base.get("F", 0.0),
-            "vc_range_80_base":  r.summary["vc_credible_range_80_base"],
-            "vc_entropy_base":   r.uncertainty["vc_entropy_base"],
-            "n_modifiers_fired": r.summary["n_modifiers_fired"],
-            "cumulative_shift":  r.summary["cumulative_shift"],
-            "mod_conf_penalty":  r.uncertainty["modifier_confidence_penalty"],
-            "flags":             "|".join(r.uncertainty["flags"]),
-            # Parsed key fields
-            "material":          r.parsed.get("material"),
-            "system":            r.parsed.get("system"),
-            "erd":               r.parsed.get("erd"),
-            "height_bin":        r.parsed.get("height_bin"),
-            "occupancy":         r.parsed.get("occupancy"),
-            "family":            r.parsed.get("family"),
-        }
-        rows.append(row)
-    return pd.DataFrame(rows)
+    # Tuple rows against a fixed column list: no per-row dict to build and
+    # no schema inference from dict keys.
+    return pd.DataFrame.from_records([_dataframe_row(r) for r in results],
+                                     columns=_DATAFRAME_COLUMNS)
 
@@ -8,10 +8,14 @@ family assignment, and the failsafe.
 
 import sys
 import os
+import json
+import pickle
+import threading
 import unittest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "engine"))
-from gem2ems_engine import gem2ems
+import gem2ems_engine
+from gem2ems_engine import gem2ems, EMS_TYPE_RULES, VC_MODIFIERS, FALLBACK_PRIORS, VC_INT
 
 eng = gem2ems()
 
@@ -187,6 +191,116 @@ class TestExactOverrides(unittest.TestCase):
             self.assertIn("EXACT_OVERRIDE", r.uncertainty["flags"])
 
 
+class TestInjectedExactOverrides(unittest.TestCase):
+    """EXACT_OVERRIDES ships empty, so patch entries into one engine."""
+
+    OVERRIDES = [
+        {"gem": "CR/LFM+CDM/H:5/IND", "ems_type": "RC1-M", "confidence": 0.99},
+        {"gem": "MUR/LWAL/H:1/IND", "ems_type": "NOT-A-TYPE"},
+        {"gem": "MUR+STRUB/LWAL+DNO/H:1/IND", "ems_type": "M1",
+         "vc_class": "A", "confidence": "0.9"},
+    ]
+
+    def setUp(self):
+        self.eng = gem2ems()
+        self.eng._exact_overrides = {ov["gem"]: ov for ov in self.OVERRIDES}
+
+    def assert_override(self, r, ems_type, vc_class, confidence, vc_range):
+        self.assertEqual(r.summary["best_ems_type"], ems_type)
+        self.assertEqual(r.ems_candidates[0]["ems_type"], ems_type)
+        self.assertEqual(r.vc_class, vc_class)
+        self.assertEqual(r.vc_class_base, vc_class)
+        self.assertEqual(r.confidence, confidence)
+        self.assertTrue(r.summary["exact_override"])
+        self.assertEqual(r.summary["best_vc_mode"], vc_class)
+        self.assertEqual(r.summary["vc_credible_range_80"], vc_range)
+        self.assertEqual(r.summary["n_modifiers_fired"], 0)
+        self.assertEqual(r.uncertainty["flags"], ["EXACT_OVERRIDE"])
+        self.assertEqual(r.vc_modifiers_applied, [])
+
+    def test_known_type_uses_its_prior(self):
+        r = self.eng.translate("CR/LFM+CDM/H:5/IND")
+        self.assert_override(r, "RC1-M", "D", 0.99, "B-D")
+        self.assertEqual(r.vc_probs, {"A": 0.0, "B": 0.133, "C": 0.267,
+                                      "D": 0.4, "E": 0.2, "F": 0.0})
+
+    def test_unknown_type_gets_uniform_prior(self):
+        r = self.eng.translate("MUR/LWAL/H:1/IND")
+        self.assert_override(r, "NOT-A-TYPE", "A", 0.99, "A-E")
+        for c in "ABCDEF":
+            self.assertAlmostEqual(r.vc_probs[c], 1 / 6, places=3)
+
+    def test_string_confidence_and_forced_vc_class(self):
+        r = self.eng.translate("MUR+STRUB/LWAL+DNO/H:1/IND")
+        self.assert_override(r, "M1", "A", 0.9, "A-A")
+        self.assertEqual(r.vc_probs["A"], 1.0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Zone A tables compiled at import
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestFrozenTables(unittest.TestCase):
+
+    def test_runtime_edits_raise(self):
+        with self.assertRaises(AttributeError):
+            EMS_TYPE_RULES.append({})
+        with self.assertRaises(AttributeError):
+            VC_MODIFIERS.append({})
+
+    def test_config_dicts_stay_serialisable(self):
+        self.assertEqual(json.loads(json.dumps(FALLBACK_PRIORS)), FALLBACK_PRIORS)
+        self.assertEqual(pickle.loads(pickle.dumps(VC_INT)), VC_INT)
+
+
+class TestGeneratedPredicates(unittest.TestCase):
+    """GENERATED_PREDICATES=False (closures / walker) must agree with the
+    exec-generated evaluators the engine uses by default."""
+
+    @classmethod
+    def setUpClass(cls):
+        fixture = os.path.join(os.path.dirname(__file__), "fixture", "expected_outputs.json")
+        with open(fixture) as f:
+            strings = list(json.load(f))
+        strings += [
+            "CR/LFINF(MUR+ADO)+DNO/H:1/IND/IRRE+IRVP+SOS",
+            "W/LFINF(MUR+ADO)+DNO/H:1/IND",
+            "MUR+CBH/LWAL+DNO/H:4/IND/YPRE:1950",
+            "CR/LFM+CDN+DUL/H:8/RES/YBET:1960-1970/IRIR+IRVS+SOS",
+            "S/LFM+CDH+DUC/H:12/COM/YEX:2005",
+        ]
+        cls.corpus = [(s, eng.translate(s).parsed) for s in strings]
+
+    def test_rule_predicates_agree(self):
+        G = gem2ems_engine
+        for rule in G._SORTED_RULES:
+            cond = rule.get("if", {})
+            closure, generated = G._compile_predicate(cond), G._generate_predicate(cond)
+            for s, parsed in self.corpus:
+                mat = parsed.get("material")
+                mat_l2 = frozenset(parsed.get("material_L2", []))
+                mat_pool = mat_l2.union(parsed.get("material_all", []), [mat] if mat else [])
+                for family in G._RULE_FAMILIES:
+                    args = (mat_pool, mat_l2, parsed.get("system"), family, parsed)
+                    self.assertEqual(closure(*args), generated(*args),
+                                     msg=f"{rule['id']} / {family} / {s}")
+
+    def test_modifier_evaluators_agree(self):
+        G = gem2ems_engine
+        buckets = list(G._VC_MODIFIERS_BY_FAMILY.values()) + [G._COMPILED_VC_MODIFIERS]
+        n_fired = 0
+        for mods in buckets:
+            walk, generated = G._walk_modifiers(mods), G._generate_modifier_evaluator(mods)
+            for s, parsed in self.corpus:
+                present = G._presence_mask(parsed)
+                for ems_type in G.EMS_VOCAB:
+                    fired = walk(parsed, ems_type, present)
+                    self.assertEqual(fired, generated(parsed, ems_type, present),
+                                     msg=f"{ems_type} / {s}")
+                    n_fired += len(fired)
+        self.assertGreater(n_fired, 0)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Batch translation
 # ─────────────────────────────────────────────────────────────────────────────
@@ -219,6 +333,139 @@ class TestBatchTranslation(unittest.TestCase):
         self.assertEqual(r_single.summary["best_ems_type"],
                          r_batch.summary["best_ems_type"])
 
+    def test_batch_with_duplicates_preserves_order(self):
+        strings = [
+            "CR/LFM+CDL+DUL/H:3/IND",
+            "MUR+STRUB/LWAL+DNO/H:2/IND",
+            "CR/LFM+CDL+DUL/H:3/IND",
+        ]
+        results = eng.translate(strings)
+        self.assertEqual([r.gem_str for r in results], strings)
+        self.assertEqual(results[0], results[2])
+
+    def test_batch_accepts_generator(self):
+        strings = ["CR/LFM+CDL+DUL/H:3/IND", "MUR+STRUB/LWAL+DNO/H:2/IND",
+                   "CR/LFM+CDL+DUL/H:3/IND"]
+        results = eng.translate(s for s in strings)
+        self.assertEqual([r.gem_str for r in results], strings)
+
+    def test_batch_duplicates_are_independent_objects(self):
+        s = "CR/LFINF(MUR+CBH)+CDL+DUL/H:3/IND"
+        r0, r1 = eng.translate([s, s])
+        self.assertIsNot(r0, r1)
+        r0.parsed["material"] = "ZZZ"
+        r0.parsed["infill_material"].append("ZZZ")
+        self.assertEqual(r1.parsed["material"], "CR")
+        self.assertNotIn("ZZZ", r1.parsed["infill_material"])
+
+    def test_batch_frame_rejects_missing_value(self):
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            self.skipTest("pandas not installed")
+        strings = ["CR/LFM+CDL+DUL/H:3/IND", None, "MUR+CBH/LWAL+DNO/H:3/IND"]
+        with self.assertRaises(ValueError):
+            eng.translate_batch(strings)
+
+    def test_parallel_matches_serial(self):
+        strings = [
+            "CR/LFM+CDL+DUL/H:3/IND",
+            "MUR+STRUB/LWAL+DNO/H:2/IND",
+            "S/LFBR+CDM+DUM/H:5/IND",
+            "W/LWAL+CDL+DUM/H:2/IND",
+            "CR/LFM+CDL+DUL/H:3/IND",
+        ]
+        serial = gem2ems(cache_size=0).translate(strings)
+        parallel = gem2ems().translate_parallel(strings, n_workers=2, chunksize=2)
+        self.assertEqual(parallel, serial)
+
+    def test_parallel_rejects_bad_sizes(self):
+        for kwargs in ({"chunksize": 0}, {"chunksize": -1}, {"n_workers": 0}, {"n_workers": -2}):
+            with self.assertRaises(ValueError):
+                eng.translate_parallel(["CR/LFM+CDL+DUL/H:3/IND"], **kwargs)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Result cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestResultCache(unittest.TestCase):
+
+    def test_shared_engine_across_threads(self):
+        # A tiny cache forces constant eviction while threads race on it.
+        shared = gem2ems(cache_size=2)
+        strings = [
+            "CR/LFM+CDL+DUL/H:3/IND",
+            "MUR+STRUB/LWAL+DNO/H:2/IND",
+            "S/LFBR+CDM+DUM/H:5/IND",
+            "W/LWAL+CDL+DUM/H:2/IND",
+        ]
+        expected = {s: gem2ems(cache_size=0).translate(s) for s in strings}
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(50):
+                    for s in strings:
+                        if shared.translate(s) != expected[s]:
+                            errors.append(s)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+    def test_editing_a_result_does_not_touch_the_cache(self):
+        s = "CR/LWAL+CDM+DUM/H:5/IND"
+        r = eng.translate(s)
+        r.summary["best_ems_type"] = "ZZZ"
+        r.ems_candidates[0]["flags"].append("ZZZ")
+        again = eng.translate(s)
+        self.assertNotEqual(again.summary["best_ems_type"], "ZZZ")
+        self.assertNotIn("ZZZ", again.ems_candidates[0]["flags"])
+
+    def test_cache_keyed_on_options(self):
+        s = "MUR+CBH/LWAL+DNO/H:3/IND"
+        r_top1 = eng.translate(s, top_k_types=1)
+        r_top3 = eng.translate(s, top_k_types=3)
+        self.assertEqual(len(r_top1.ems_candidates), 1)
+        self.assertGreater(len(r_top3.ems_candidates), 1)
+
+    def test_cache_clear(self):
+        s = "S/LFBR+CDM+DUM/H:5/IND"
+        r1 = eng.translate(s)
+        eng.cache_clear()
+        r2 = eng.translate(s)
+        self.assertIsNot(r1, r2)
+        self.assertEqual(r1, r2)
+
+    def test_result_fields_are_assignable(self):
+        s = "CR/LFM+CDL+DUL/H:3/IND"
+        r = eng.translate(s)
+        r.vc_class = "F"
+        self.assertEqual(r.vc_class, "F")
+        self.assertNotEqual(eng.translate(s).vc_class, "F")
+
+    def test_copy_is_independent_of_cache(self):
+        s = "S/LFBR+CDM+DUM/H:5/IND"
+        c = eng.translate(s).copy()
+        c.summary["best_ems_type"] = "M1"
+        self.assertEqual(c.summary["best_ems_type"], "M1")
+        self.assertNotEqual(eng.translate(s).summary["best_ems_type"], "M1")
+
+    def test_result_pickle_round_trip(self):
+        r = eng.translate("CR/LFINF(MUR+CBH)+CDL+DUL/H:3/IND")
+        self.assertEqual(pickle.loads(pickle.dumps(r)), r)
+
+    def test_cache_disabled(self):
+        uncached = gem2ems(cache_size=0)
+        s = "W/LWAL+CDL+DUM/H:2/IND"
+        self.assertIsNot(uncached.translate(s), uncached.translate(s))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,7 +9,7 @@ import os
 import unittest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "engine"))
-from gem2ems_engine import gem2ems
+from gem2ems_engine import gem2ems, GemParser
 
 eng = gem2ems()
 
@@ -237,5 +237,33 @@ class TestIrregularity(unittest.TestCase):
         self.assertEqual(p["irregularity_vert_types"], [])
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Parse cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestParseCache(unittest.TestCase):
+
+    def test_repeated_parse_returns_independent_copies(self):
+        s = "CR/LFINF(MUR+CBH)+CDL+DUL/H:3/IND"
+        p1 = GemParser().parse(s)
+        p1["infill_material"].append("ADO")
+        p1["family"] = "RC"
+        p2 = GemParser().parse(s)
+        self.assertEqual(p2["infill_material"], ["MUR", "CBH"])
+        self.assertIsNone(p2["family"])
+
+    def test_subclass_override_is_not_bypassed(self):
+        class TaggingParser(GemParser):
+            def _parse(self, gem_str):
+                out = super()._parse(gem_str)
+                out["system"] = "TAGGED"
+                return out
+
+        s = "CR/LFM+CDL+DUL/H:3/IND"
+        GemParser().parse(s)
+        self.assertEqual(TaggingParser().parse(s)["system"], "TAGGED")
+        self.assertEqual(GemParser().parse(s)["system"], "LFM")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,7 @@ Unit tests for the VC modifier engine:
 
 import sys
 import os
+import math
 import unittest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "engine"))
@@ -57,19 +58,22 @@ class TestModifierFiring(unittest.TestCase):
 # Shift direction
 # ─────────────────────────────────────────────────────────────────────────────
 
-class TestShiftDirection(unittest.TestCase):
+_VC_RANK = {"A": 1, "B": 2, "C": 3, "D": 4, "E": 5, "F": 6}
+
+
+def _weighted_mean(vc_probs):
+    """Compute the probability-weighted mean VC class index (A=1…F=6)."""
+    return sum(_VC_RANK[k] * v for k, v in vc_probs.items())
 
-    def _weighted_mean(self, vc_probs):
-        """Compute the probability-weighted mean VC class index (A=1…F=6)."""
-        order = {"A": 1, "B": 2, "C": 3, "D": 4, "E": 5, "F": 6}
-        return sum(order[k] * v for k, v in vc_probs.items())
+
+class TestShiftDirection(unittest.TestCase):
 
     def test_positive_shift_moves_toward_more_vulnerable(self):
         # DNO is a positive shift (more vulnerable)
         r = translate("MUR+CBH/LWAL+DNO/H:4/IND")
         if r.summary["n_modifiers_fired"] > 0 and r.summary["cumulative_shift"] > 0:
-            mean_base  = self._weighted_mean(r.vc_probs_base)
-            mean_final = self._weighted_mean(r.vc_probs)
+            mean_base  = _weighted_mean(r.vc_probs_base)
+            mean_final = _weighted_mean(r.vc_probs)
             self.assertLessEqual(mean_final, mean_base + 0.01,
                 msg="Positive shift should move distribution toward A (lower mean index).")
 
@@ -107,7 +111,7 @@ class TestIMSBounds(unittest.TestCase):
         ]
         for s in strings:
             r = translate(s)
-            total = sum(r.vc_probs.values())
+            total = math.fsum(r.vc_probs.values())
             self.assertAlmostEqual(total, 1.0, places=3,
                 msg=f"vc_probs does not sum to 1 after shift for: {s}")
 
@@ -140,26 +144,27 @@ class TestCumulativeShiftCap(unittest.TestCase):
 
 class TestModifierConfidencePenalty(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Clean string (no modifiers) and a string with modifiers
+        cls.r_clean = translate("CR/LWAL+CDM+DUM/H:5/IND")
+        cls.r_mod   = translate("MUR+CBH/LWAL+DNO/H:4/IND")
+
     def test_modifiers_reduce_confidence(self):
-        # Clean string (no modifiers)
-        r_clean = translate("CR/LWAL+CDM+DUM/H:5/IND")
-        # String with modifiers
-        r_mod   = translate("MUR+CBH/LWAL+DNO/H:4/IND")
         # The modifier string may have lower confidence due to penalty
         # (not guaranteed since base confidence can differ — check penalty field)
-        penalty = r_mod.uncertainty["modifier_confidence_penalty"]
+        penalty = self.r_mod.uncertainty["modifier_confidence_penalty"]
         self.assertLessEqual(penalty, 1.0)
 
     def test_no_modifier_means_penalty_is_one(self):
-        r = translate("CR/LWAL+CDM+DUM/H:5/IND")
+        r = self.r_clean
         self.assertAlmostEqual(r.uncertainty["modifier_confidence_penalty"], 1.0, places=4)
 
     def test_modifier_penalty_is_product_of_individual_penalties(self):
-        r = translate("MUR+CBH/LWAL+DNO/H:4/IND")
+        r = self.r_mod
         if r.vc_modifiers_applied:
-            product = 1.0
-            for m in r.vc_modifiers_applied:
-                product *= m.get("confidence_penalty", 1.0)
+            product = math.prod(m.get("confidence_penalty", 1.0)
+                                for m in r.vc_modifiers_applied)
             self.assertAlmostEqual(
                 r.uncertainty["modifier_confidence_penalty"],
                 product, places=4
@@ -172,12 +177,16 @@ class TestModifierConfidencePenalty(unittest.TestCase):
 
 class TestBaseVsFinal(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.r_clean = translate("CR/LWAL+CDM+DUM/H:5/IND")
+
     def test_base_class_unchanged_when_no_modifiers(self):
-        r = translate("CR/LWAL+CDM+DUM/H:5/IND")
+        r = self.r_clean
         self.assertEqual(r.vc_class_base, r.vc_class)
 
     def test_base_and_final_vc_probs_unchanged_when_no_modifiers(self):
-        r = translate("CR/LWAL+CDM+DUM/H:5/IND")
+        r = self.r_clean
         for cls in "ABCDEF":
             self.assertAlmostEqual(
                 r.vc_probs_base.get(cls, 0),
@@ -185,7 +194,7 @@ class TestBaseVsFinal(unittest.TestCase):
             )
 
     def test_n_modifiers_reported_correctly(self):
-        r = translate("CR/LWAL+CDM+DUM/H:5/IND")
+        r = self.r_clean
         self.assertEqual(r.summary["n_modifiers_fired"], len(r.vc_modifiers_applied))
 
 